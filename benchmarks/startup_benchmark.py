@@ -0,0 +1,99 @@
+"""
+Cold start benchmark for the page registry.
+
+Each measurement runs in a fresh interpreter and times the imports app.py
+runs before the first page can paint:
+
+    * baseline: the top-level imports of app.py at a baseline commit (by
+      default the repository's first commit), run against that commit's
+      tree, which imported every page module up front
+    * lazy:     the top-level imports of the current app.py plus only the
+      selected page module
+
+Only the import statements are replayed (parsed from app.py), not the rest
+of the script, so no sheets are fetched.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--repeats N] [--baseline REV]
+"""
+import argparse
+import ast
+import io
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+LAZY = """
+import src.pages.registry as registry
+registry.PAGES[{page!r}].load()
+"""
+
+
+def _app_imports(source: str) -> str:
+    """
+    The top-level import statements of an app.py source.
+    """
+    tree = ast.parse(source)
+    return "\n".join(
+        ast.get_source_segment(source, node)
+        for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))
+    )
+
+
+def _git(*args: str) -> bytes:
+    return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, check=True).stdout
+
+
+def _extract(rev: str, target: str):
+    """
+    Writes the tree of a commit to target.
+    """
+    with tarfile.open(fileobj=io.BytesIO(_git("archive", rev))) as archive:
+        archive.extractall(target)
+
+
+def _time_snippet(snippet: str, cwd: Path | str = ROOT) -> float:
+    """
+    Seconds taken to run snippet in a fresh interpreter (imports included).
+    """
+    code = f"import time\nstart = time.perf_counter()\n{snippet}\nprint(time.perf_counter() - start)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--baseline", help="commit whose app.py is the baseline (default: the first commit)")
+    args = parser.parse_args()
+
+    baseline_rev = args.baseline or _git("rev-list", "--max-parents=0", "HEAD").decode().split()[0]
+
+    sys.path.insert(0, str(ROOT))
+    from src.pages.registry import PAGES
+
+    current_imports = _app_imports((ROOT / "app.py").read_text())
+
+    with tempfile.TemporaryDirectory() as baseline_root:
+        _extract(baseline_rev, baseline_root)
+        baseline_imports = _app_imports((Path(baseline_root) / "app.py").read_text())
+        baseline = statistics.median(
+            _time_snippet(baseline_imports, cwd=baseline_root) for _ in range(args.repeats)
+        )
+    print(f"{'baseline app.py @ ' + baseline_rev[:7]:<28}{baseline * 1000:>10.1f} ms")
+
+    for page in PAGES:
+        snippet = current_imports + LAZY.format(page=page)
+        lazy = statistics.median(_time_snippet(snippet) for _ in range(args.repeats))
+        print(f"{'lazy: ' + page:<28}{lazy * 1000:>10.1f} ms  ({baseline / lazy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
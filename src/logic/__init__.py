@@ -1 +1,9 @@
-from .calculate_weekly_scores import calculate_weekly_scores
\ No newline at end of file
+from .pick_overlap import PickOverlap, build_pick_overlap, get_pick_overlap
+from .pick_popularity import PickPopularity, build_contrarian, build_pick_popularity
+from .player_directory import PlayerDirectory, build_player_directory
+from .player_stats import build_leaderboard, build_player_stats
+from .season_model import SeasonModel, get_season_model
+from .standings_cube import StandingsCube, build_standings_cube
+from .season_simulator import SimulationInputs, build_simulation_inputs, get_projections, simulate_season
+from .survivor_planner import get_survivor_plan, plan_survivor_path
+from .survivor_usage import SurvivorUsage, build_survivor_usage
@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# local imports
+from src.utils import OutcomeIndex
+from src.utils.season_schema import PICK_COLS
+from .season_model import SeasonModel
+
+@dataclass(frozen=True)
+class PickOverlap:
+    """
+    How every pair of players' picks compare, as player x player matrices.
+
+    Cell [a, b] reads from player a's side: `spread_split_wins[a, b]` counts
+    games where a and b took opposite sides and a's side covered.
+
+    Attributes:
+        players (np.ndarray): Player names, one per row/column.
+        index (pd.Index): Player name -> row lookup.
+        survivor_shared (np.ndarray): Weeks both picked the same survivor team.
+        spread_shared (np.ndarray): Spread picks both made (same week and team).
+            The diagonal is each player's own number of spread picks.
+        spread_splits (np.ndarray): Games where the two took opposite sides.
+        spread_split_wins (np.ndarray): Splits where a's side covered.
+        survivor_split_wins (np.ndarray): Weeks a's survivor pick won and b's lost.
+        similarity (np.ndarray): Share of two players' spread picks they have
+            in common (Jaccard).
+
+    Counts are int16 (a season has at most a few hundred picks per player).
+    """
+    players: np.ndarray
+    index: pd.Index
+    survivor_shared: np.ndarray
+    spread_shared: np.ndarray
+    spread_splits: np.ndarray
+    spread_split_wins: np.ndarray
+    survivor_split_wins: np.ndarray
+    similarity: np.ndarray
+
+    def head_to_head(self, player_a: str, player_b: str) -> dict:
+        """
+        Overlap summary for one pair, from player_a's side.
+        """
+        a, b = self.index.get_loc(player_a), self.index.get_loc(player_b)
+        return {
+            "Survivor Shared": int(self.survivor_shared[a, b]),
+            "Survivor Wins": int(self.survivor_split_wins[a, b]),
+            "Survivor Losses": int(self.survivor_split_wins[b, a]),
+            "Spread Shared": int(self.spread_shared[a, b]),
+            "Spread Splits": int(self.spread_splits[a, b]),
+            "Split Wins": int(self.spread_split_wins[a, b]),
+            "Split Losses": int(self.spread_split_wins[b, a]),
+            "Similarity": float(self.similarity[a, b]),
+        }
+
+    def most_similar(self, player: str, n: int = 10) -> pd.DataFrame:
+        """
+        The n players whose spread picks overlap the most with player's.
+        """
+        a = self.index.get_loc(player)
+        similarity = self.similarity[a].copy()
+        similarity[a] = -1.0
+        order = np.lexsort((self.players, -similarity))[:min(n, len(self.players) - 1)]
+        return pd.DataFrame({
+            "Player": self.players[order],
+            "Similarity": similarity[order],
+            "Spread Shared": self.spread_shared[a, order],
+            "Survivor Shared": self.survivor_shared[a, order],
+            "Splits": self.spread_splits[a, order],
+            "Split Record": [f"{w}-{l}" for w, l in zip(self.spread_split_wins[a, order], self.spread_split_wins[order, a])],
+        })
+
+
+def build_pick_overlap(overall_scores: pd.DataFrame, outcomes: OutcomeIndex, through_week: int) -> PickOverlap:
+    """
+    Compares every pair of players' picks in weeks 1..through_week.
+
+    Picks are one-hot encoded over (week, team) columns, so every matrix is a
+    single (players x cells) @ (cells x players) product. Splits pair each
+    pick with the opposing team's column, survivor splits compare weeks, and
+    wins only count finished games.
+    """
+    player_codes, players = pd.factorize(overall_scores["Player"], sort=False)
+    players = np.asarray(players, dtype=object)
+    num_teams = len(outcomes.teams)
+    num_weeks = min(max(int(through_week), 0), outcomes.num_weeks)
+
+    weeks = overall_scores["Week"].to_numpy(dtype=np.intp)
+    codes = np.column_stack([overall_scores[col].cat.codes.to_numpy() for col in PICK_COLS]).astype(np.intp)
+    keep = (player_codes >= 0) & (weeks >= 1) & (weeks <= num_weeks)
+    player_codes, weeks, codes = player_codes[keep], weeks[keep], codes[keep]
+
+    # one-hot (player, week * teams + team) picks; unknown teams are dropped
+    num_cells = (num_weeks + 1) * num_teams
+
+    def one_hot(picks: np.ndarray) -> np.ndarray:
+        rows = np.repeat(player_codes, picks.shape[1])
+        cells = (weeks[:, None] * num_teams + picks).ravel()
+        known = ((picks >= 0) & (picks < num_teams)).ravel()
+        matrix = np.zeros((len(players), num_cells), dtype=np.float32)
+        matrix[rows[known], cells[known]] = 1.0
+        return matrix
+
+    survivor, spread = one_hot(codes[:, :1]), one_hot(codes[:, 1:])
+
+    # per-cell outcomes and the column of each cell's opponent (last column is empty)
+    cell_week = np.repeat(np.arange(num_weeks + 1), num_teams)
+    cell_team = np.tile(np.arange(num_teams), num_weeks + 1)
+    final = outcomes.final[cell_week, cell_team]
+    covered = final & (outcomes.base_points[cell_week, cell_team] == 1.0)
+    won = final & outcomes.game_winner[cell_week, cell_team]
+    lost = final & ~outcomes.game_winner[cell_week, cell_team] & ~outcomes.tie[cell_week, cell_team]
+    opponent = outcomes.opponent[cell_week, cell_team].astype(np.intp)
+    opponent_cell = np.where(opponent >= 0, cell_week * num_teams + opponent, num_cells)
+    spread_opponent = np.pad(spread, ((0, 0), (0, 1)))[:, opponent_cell]
+
+    def product(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        return np.rint(left @ right.T).astype(np.int16)
+
+    def by_week(cells: np.ndarray) -> np.ndarray:
+        return cells.reshape(len(players), num_weeks + 1, num_teams).sum(axis=2)
+
+    spread_shared = product(spread, spread)
+    return PickOverlap(
+        players=players,
+        index=pd.Index(players),
+        survivor_shared=product(survivor, survivor),
+        spread_shared=spread_shared,
+        spread_splits=product(spread, spread_opponent),
+        spread_split_wins=product(spread * covered, spread_opponent),
+        survivor_split_wins=product(by_week(survivor * won), by_week(survivor * lost)),
+        similarity=_jaccard(spread_shared),
+    )
+
+
+def _jaccard(shared: np.ndarray) -> np.ndarray:
+    """
+    Pairwise Jaccard similarity from shared counts (own counts on the diagonal).
+    """
+    picks = np.diag(shared).astype(np.float32)
+    union = picks[:, None] + picks[None, :] - shared
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(union > 0, shared / union, 0.0).astype(np.float32)
+
+
+@st.cache_resource(max_entries=4)
+def _cached_overlap(key: tuple, through_week: int, _season_model: SeasonModel) -> PickOverlap:
+    return build_pick_overlap(_season_model.scores, _season_model.season.outcomes, through_week)
+
+
+def get_pick_overlap(season_model: SeasonModel, through_week: int) -> PickOverlap:
+    """
+    Returns the league's pick overlap through a week, cached per data version.
+    """
+    return _cached_overlap(season_model.key, int(through_week), season_model)
@@ -0,0 +1,181 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# local imports
+from src.utils import OutcomeIndex
+from src.utils.season_schema import PICK_COLS
+
+@dataclass(frozen=True)
+class PickPopularity:
+    """
+    League pick counts for every week and pick slot, from one pass over the
+    season's picks.
+
+    Team columns follow the shared pick categorical (see `compact_scores`):
+    registry teams first (their position is their team ID), then any other
+    spellings seen.
+
+    Attributes:
+        teams (np.ndarray): Team label of each column.
+        counts (np.ndarray): Picks per (week, slot in PICK_COLS, team).
+        outcomes (OutcomeIndex): Game outcomes the results are read from.
+    """
+    teams: np.ndarray
+    counts: np.ndarray
+    outcomes: OutcomeIndex
+
+    @property
+    def spread_counts(self) -> np.ndarray:
+        """
+        Spread picks per (week, team), all spread slots combined.
+        """
+        return self.counts[:, 1:].sum(axis=1)
+
+    def breakdown(self, week: int, survivor: bool) -> pd.DataFrame:
+        """
+        Most picked teams for a week, with their share of picks and result.
+        """
+        if survivor:
+            counts, result = self.counts[week, 0], self._results(week, survivor=True)
+        else:
+            counts, result = self.spread_counts[week], self._results(week, survivor=False)
+        picked = np.flatnonzero(counts)
+        picked = picked[np.lexsort((picked, -counts[picked]))]
+        total = counts.sum()
+
+        return pd.DataFrame({
+            "Team": self.teams[picked],
+            "Picks": counts[picked],
+            "%": (counts[picked] / max(total, 1) * 100).round(1),
+            "Result": result[picked],
+        })
+
+    def consensus_by_week(self) -> pd.DataFrame:
+        """
+        How the league's most popular picks fared, one row per week with picks.
+        """
+        weeks = np.flatnonzero(self.counts[:, 0].sum(axis=1))
+        survivor_top = self.counts[weeks, 0].argmax(axis=1)
+        spread_counts = self.spread_counts[weeks]
+        spread_top = spread_counts.argmax(axis=1)
+
+        # share of finished spread picks that covered (pushes count half)
+        final = self._final()[weeks]
+        settled = (spread_counts * final).sum(axis=1)
+        covered = (spread_counts * final * self._base_points()[weeks]).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            league_ats = np.where(settled > 0, covered / settled * 100, np.nan)
+
+        return pd.DataFrame({
+            "Week": weeks,
+            "Top Survivor": self.teams[survivor_top],
+            "Survivor Share": self.counts[weeks, 0, survivor_top] / np.maximum(self.counts[weeks, 0].sum(axis=1), 1) * 100,
+            "Survivor Result": [self._results(w, survivor=True)[t] for w, t in zip(weeks, survivor_top)],
+            "Top Spread": self.teams[spread_top],
+            "Spread Share": spread_counts[np.arange(len(weeks)), spread_top] / np.maximum(spread_counts.sum(axis=1), 1) * 100,
+            "Spread Result": [self._results(w, survivor=False)[t] for w, t in zip(weeks, spread_top)],
+            "League ATS %": league_ats,
+        })
+
+    def _results(self, week: int, survivor: bool) -> np.ndarray:
+        """
+        Result label of each team column for a week ("" if not final or unknown).
+        """
+        result = np.full(len(self.teams), "", dtype=object)
+        num_teams = len(self.outcomes.teams)
+        if week > self.outcomes.num_weeks:
+            return result
+        final = self.outcomes.final[week, :num_teams]
+        if survivor:
+            labels = np.where(self.outcomes.game_winner[week, :num_teams], "Won", "Lost")
+        else:
+            base = self.outcomes.base_points[week, :num_teams]
+            labels = np.where(base == 1.0, "Covered", np.where(base == 0.5, "Push", "Lost"))
+        result[:num_teams] = np.where(final, labels, "")
+        return result
+
+    def _base_points(self) -> np.ndarray:
+        return _team_columns(self.outcomes.base_points, len(self.teams), self.counts.shape[0])
+
+    def _final(self) -> np.ndarray:
+        return _team_columns(self.outcomes.final, len(self.teams), self.counts.shape[0])
+
+
+def build_pick_popularity(overall_scores: pd.DataFrame, outcomes: OutcomeIndex) -> PickPopularity:
+    """
+    Counts every pick slot for every week, from compact overall scores (see
+    `compact_scores`).
+    """
+    teams = np.asarray(overall_scores[PICK_COLS[0]].cat.categories, dtype=object)
+    codes = np.column_stack([overall_scores[col].cat.codes.to_numpy() for col in PICK_COLS]).astype(np.intp)
+    weeks = overall_scores["Week"].to_numpy(dtype=np.intp)
+    num_weeks = max(int(weeks.max(initial=0)), outcomes.num_weeks)
+
+    # (week, slot, team) counts in a single bincount
+    row, slot = np.nonzero(codes >= 0)
+    keys = (weeks[row] * len(PICK_COLS) + slot) * len(teams) + codes[row, slot]
+    counts = np.bincount(keys, minlength=(num_weeks + 1) * len(PICK_COLS) * len(teams))
+    counts = counts.reshape(num_weeks + 1, len(PICK_COLS), len(teams))
+
+    return PickPopularity(teams=teams, counts=counts, outcomes=outcomes)
+
+
+def build_contrarian(overall_scores: pd.DataFrame, outcomes: OutcomeIndex, through_week: int) -> pd.DataFrame:
+    """
+    Scores each player's consensus fades in weeks 1..through_week, indexed
+    by player.
+
+    A spread pick fades the consensus when the league picked the other side
+    of that game more often. Weeks after through_week are dropped before
+    counting, so picks that are not released yet never shape the numbers,
+    and only finished games count toward the fades.
+    """
+    num_teams = len(outcomes.teams)
+    through_week = min(max(int(through_week), 0), outcomes.num_weeks)
+    player_codes = overall_scores["Player"].cat.codes.to_numpy()
+    players = np.asarray(overall_scores["Player"].cat.categories, dtype=object)
+    weeks = overall_scores["Week"].to_numpy(dtype=np.intp)
+    keep = (player_codes >= 0) & (weeks >= 0) & (weeks <= through_week)
+    picks = np.column_stack([overall_scores[col].cat.codes.to_numpy() for col in PICK_COLS[1:]]).astype(np.intp)
+    player_codes, weeks, picks = player_codes[keep], weeks[keep], picks[keep]
+
+    # released spread picks per (week, team), registry teams only
+    # (an unknown team, -1, lands on the empty last column)
+    pick_weeks = np.broadcast_to(weeks[:, None], picks.shape)
+    team = np.where((picks >= 0) & (picks < num_teams), picks, -1)
+    known = team >= 0
+    spread_counts = np.bincount(
+        pick_weeks[known] * (num_teams + 1) + team[known], minlength=(through_week + 1) * (num_teams + 1)
+    ).reshape(through_week + 1, num_teams + 1)
+
+    settled = outcomes.final[pick_weeks, team]
+    opponent = outcomes.opponent[pick_weeks, team]
+    faded = settled & (spread_counts[pick_weeks, team] < spread_counts[pick_weeks, opponent])
+    fade_covered = faded & (outcomes.base_points[pick_weeks, team] == 1.0)
+
+    def per_player(flags: np.ndarray) -> np.ndarray:
+        return np.bincount(player_codes, weights=flags.sum(axis=1), minlength=len(players))
+
+    spread_picks, fades, covered = per_player(settled), per_player(faded), per_player(fade_covered)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        contrarian = pd.DataFrame({
+            "Spread Picks": spread_picks.astype(int),
+            "Fades": fades.astype(int),
+            "Contrarian %": fades / spread_picks * 100,
+            "Fade Cover %": np.where(fades > 0, covered / fades * 100, np.nan),
+        }, index=pd.Index(players, name="Player"))
+    return contrarian.loc[contrarian["Spread Picks"] > 0]
+
+
+def _team_columns(values: np.ndarray, num_columns: int, num_weeks: int) -> np.ndarray:
+    """
+    Registry-team outcome values laid out like the popularity columns
+    (zeros for weeks or columns the outcome index doesn't cover).
+    """
+    out = np.zeros((num_weeks, num_columns), dtype=float)
+    weeks = min(num_weeks, values.shape[0])
+    teams = min(num_columns, values.shape[1] - 1)
+    out[:weeks, :teams] = values[:weeks, :teams]
+    return out
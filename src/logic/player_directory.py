@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+@dataclass(frozen=True)
+class PlayerDirectory:
+    """
+    Players in display order and the rows of overall_scores belonging to each.
+
+    Attributes:
+        names (list[str]): Player names, sorted case-insensitively.
+        positions (dict[str, np.ndarray]): Player -> row positions in overall_scores.
+    """
+    names: list[str]
+    positions: dict[str, np.ndarray]
+
+    def __contains__(self, player: str) -> bool:
+        return player in self.positions
+
+    def rows(self, overall_scores: pd.DataFrame, player: str) -> pd.DataFrame:
+        """
+        A player's rows, without scanning the Player column.
+        """
+        return overall_scores.iloc[self.positions.get(player, np.array([], dtype=np.intp))]
+
+
+def build_player_directory(overall_scores: pd.DataFrame) -> PlayerDirectory:
+    """
+    Groups overall_scores by player once (a single groupby indexer pass).
+    """
+    positions = overall_scores.groupby("Player", observed=True, sort=False).indices
+    names = sorted(positions, key=lambda s: s.strip().lower())
+    return PlayerDirectory(names=names, positions=positions)
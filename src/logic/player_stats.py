@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+# local imports
+from src.utils.season_schema import PICK_COLS, SPREAD_POINT_COLS, SPREAD_WEIGHTS
+
+SURVIVOR_WEEKS = 18
+ATS_PICKS_PER_WEEK = 5
+TWO_POINT_MAX = 2 * SURVIVOR_WEEKS
+EMPTY_TOKENS = {"", "nan", "none", "null", "-", "—", "n/a"}
+
+def build_player_stats(overall_scores: pd.DataFrame) -> pd.DataFrame:
+    """
+    Season stats for every player in one vectorized pass, indexed by player.
+
+    Columns:
+        * Survivor Correct, Survivor Hit Rate: correct survivor picks (and % of the season)
+        * ATS Correct, ATS Hit Rate: correct spread picks, ignoring survivor (and % of the season)
+        * Final Score: Total Points
+        * Total Possible Points: spread points as if every survivor pick had won
+        * ATS Conversion: Final Score as a % of Total Possible Points
+        * 2 Point Success: 2 point spread points as a % of the season maximum
+        * Biggest Letdown, Letdown Week, Points Missed: the losing survivor
+          pick that cost the most spread points (earliest week on ties)
+        * Most Picked ATS, Times Picked: most picked spread team (alphabetical
+          on ties)
+    """
+    player_codes, players = pd.factorize(overall_scores["Player"], sort=False)
+    keep = player_codes >= 0
+    scores = overall_scores.loc[keep]
+    player_codes = player_codes[keep]
+    num_players = len(players)
+
+    def per_player(values: np.ndarray) -> np.ndarray:
+        return np.bincount(player_codes, weights=values, minlength=num_players)
+
+    # survivor / ATS / scoring totals
+    spread_points = scores[SPREAD_POINT_COLS].to_numpy(dtype=float)
+    spread_total = spread_points.sum(axis=1)
+    weights = np.fromiter(SPREAD_WEIGHTS.values(), dtype=float)
+    survivor_correct = per_player(scores["Survivor Point"].to_numpy(dtype=float))
+    ats_correct = per_player((spread_points / weights).sum(axis=1))
+    final_score = per_player(scores["Total Points"].to_numpy(dtype=float))
+    possible = per_player(spread_total)
+    two_point = per_player(spread_points[:, 0])
+
+    # biggest survivor letdown: max spread points in a losing survivor week
+    lost = np.flatnonzero(scores["Survivor Point"].to_numpy() == 0)
+    order = lost[np.lexsort((lost, -spread_total[lost], player_codes[lost]))]
+    first = order[np.r_[True, player_codes[order][1:] != player_codes[order][:-1]]] if len(order) else order
+    letdown_team = np.full(num_players, None, dtype=object)
+    letdown_week = np.full(num_players, np.nan)
+    points_missed = np.full(num_players, np.nan)
+    letdown_team[player_codes[first]] = scores["Survivor Pick"].to_numpy(dtype=object)[first]
+    letdown_week[player_codes[first]] = scores["Week"].to_numpy(dtype=float)[first]
+    points_missed[player_codes[first]] = spread_total[first]
+
+    # most picked spread team
+    team_codes, teams = pd.factorize(scores[PICK_COLS[1:]].to_numpy(dtype=object).ravel(), sort=True)
+    pick_players = np.repeat(player_codes, len(PICK_COLS) - 1)
+    blank = pd.Index(teams, dtype=object).astype(str).str.strip().str.lower().isin(EMPTY_TOKENS)
+    picked = (team_codes >= 0) & ~np.append(blank, True)[team_codes]
+    counts = np.zeros((num_players, max(len(teams), 1)), dtype=np.int64)
+    np.add.at(counts, (pick_players[picked], team_codes[picked]), 1)
+    most_picked = np.where(counts.max(axis=1) > 0, np.append(teams, None)[counts.argmax(axis=1)], None)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return pd.DataFrame({
+            "Survivor Correct": survivor_correct.astype(int),
+            "Survivor Hit Rate": survivor_correct / SURVIVOR_WEEKS * 100,
+            "ATS Correct": ats_correct,
+            "ATS Hit Rate": ats_correct / (SURVIVOR_WEEKS * ATS_PICKS_PER_WEEK) * 100,
+            "Final Score": final_score,
+            "Total Possible Points": possible,
+            "ATS Conversion": np.where(possible > 0, final_score / possible * 100, np.nan),
+            "2 Point Success": two_point / TWO_POINT_MAX * 100,
+            "Biggest Letdown": letdown_team,
+            "Letdown Week": pd.array(letdown_week, dtype="Int64"),
+            "Points Missed": points_missed,
+            "Most Picked ATS": most_picked,
+            "Times Picked": counts.max(axis=1),
+        }, index=pd.Index(np.asarray(players, dtype=object), name="Player"))
+
+
+def build_leaderboard(player_stats: pd.DataFrame) -> pd.DataFrame:
+    """
+    All-player leaderboard ranked by Final Score (ties share the minimum rank).
+    """
+    leaderboard = (
+        player_stats
+        .reset_index()
+        .sort_values(["Final Score", "Player"], ascending=[False, True], key=_case_insensitive)
+        .reset_index(drop=True)
+    )
+    leaderboard.insert(0, "Rank", leaderboard["Final Score"].rank(method="min", ascending=False).astype(int))
+    return leaderboard
+
+
+def _case_insensitive(column: pd.Series) -> pd.Series:
+    return column.str.lower() if column.dtype == object else column
@@ -0,0 +1,220 @@
+import threading
+from dataclasses import dataclass, replace
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# local imports
+from src.utils import LiveUpdate, Season, calculate_week, get_score_cache, load_season
+from src.utils.data_repository import season_sheet_keys, sheet_cache
+from .pick_popularity import PickPopularity, build_contrarian, build_pick_popularity
+from .player_directory import PlayerDirectory, build_player_directory
+from .player_stats import build_leaderboard, build_player_stats
+from .standings_cube import StandingsCube, build_standings_cube
+from .survivor_usage import SurvivorUsage, build_survivor_usage
+
+@dataclass(frozen=True)
+class SeasonModel:
+    """
+    Immutable snapshot of everything derived from one data refresh.
+
+    Snapshots are shared by every session, so treat the frames as read-only
+    (copy before mutating). Derived views that not every page needs are
+    cached properties, built once per snapshot on first use.
+
+    Attributes:
+        key (tuple): (week, sheet cache version) the snapshot was built from.
+        season (Season): The season's week, teams and outcomes. The raw
+            per-week picks and games are dropped once scored (the sheet
+            cache still holds the sheets).
+        scores (pd.DataFrame): Overall scores, one row per player per week.
+        standings (StandingsCube): Cumulative player x week points.
+        players (pd.DataFrame): Per-player season summary, indexed by player.
+    """
+    key: tuple
+    season: Season
+    scores: pd.DataFrame
+    standings: StandingsCube
+    players: pd.DataFrame
+
+    @property
+    def week(self) -> int:
+        return self.season.week
+
+    @property
+    def open_weeks(self) -> np.ndarray:
+        """
+        Weeks whose scores can still change, indexed by week: a game is
+        unplayed or no games are listed yet.
+        """
+        outcomes = self.season.outcomes
+        return ~(outcomes.final | ~outcomes.has_game).all(axis=1) | ~outcomes.has_game.any(axis=1)
+
+    @cached_property
+    def player_directory(self) -> PlayerDirectory:
+        """
+        Sorted player names and each player's score rows, built on first use.
+        """
+        return build_player_directory(self.scores)
+
+    def player_scores(self, player: str) -> pd.DataFrame:
+        """
+        A player's rows of scores (read-only).
+        """
+        return self.player_directory.rows(self.scores, player)
+
+    @cached_property
+    def survivor_usage(self) -> SurvivorUsage:
+        """
+        Survivor teams used by every player, built on first use.
+        """
+        return build_survivor_usage(self.scores, self.season.teams, self.standings.num_weeks)
+
+    @cached_property
+    def player_stats(self) -> pd.DataFrame:
+        """
+        Per-player season stats (see `build_player_stats`), built on first use.
+        """
+        return build_player_stats(self.scores)
+
+    @cached_property
+    def leaderboard(self) -> pd.DataFrame:
+        """
+        All-player leaderboard ranked by Final Score, built on first use.
+        """
+        return build_leaderboard(self.player_stats)
+
+    @cached_property
+    def pick_popularity(self) -> PickPopularity:
+        """
+        League pick counts and consensus fades for every week, built on first use.
+        """
+        return build_pick_popularity(self.scores, self.season.outcomes)
+
+    def contrarian(self, through_week: int) -> pd.DataFrame:
+        """
+        Per-player consensus fades in weeks 1..through_week (see
+        `build_contrarian`), built once per cutoff.
+        """
+        return _cached_contrarian(self.key, int(through_week), self)
+
+
+class SeasonModelStore:
+    """
+    Holds the current SeasonModel and rebuilds it behind a single-flight lock.
+
+    Sessions that find the snapshot up to date return it without any work;
+    when the data changes, only one builder runs and every other session
+    waiting on the lock picks up its result.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._model: SeasonModel | None = None
+
+    def get(self, app_config: dict) -> SeasonModel:
+        model = self._model
+        if model is not None and not self._is_stale(app_config, model):
+            return model
+
+        with self._lock:
+            # another session may have rebuilt while we waited
+            model = self._model
+            if model is not None and not self._is_stale(app_config, model):
+                return model
+
+            self._model = build_season_model(app_config, previous=model)
+            return self._model
+
+    @staticmethod
+    def _is_stale(app_config: dict, model: SeasonModel) -> bool:
+        # only the sheets the season is built from can make it stale
+        cache = sheet_cache(app_config)
+        hard_expired = cache.revalidate(season_sheet_keys(app_config, model.season.week))
+        return hard_expired or model.key != (calculate_week(), cache.version)
+
+
+def build_season_model(app_config: dict, previous: SeasonModel | None = None) -> SeasonModel:
+    """
+    Loads, scores and summarizes the season.
+
+    If the scores were live-patched from the previous snapshot's frame (only
+    game outcomes changed), the standings and player summaries are patched
+    for the affected players instead of being rebuilt.
+    """
+    # version is read before loading so that data refreshed mid-build
+    # triggers another build on the next request
+    week = calculate_week()
+    key = (week, sheet_cache(app_config).version)
+
+    season = load_season(app_config, week)
+    scores, update = get_score_cache().score_live(season)
+
+    if previous is not None and scores is previous.scores:
+        standings, players = previous.standings, previous.players
+    elif previous is not None and update is not None and update.base is previous.scores:
+        standings = previous.standings.apply_deltas(update.players, update.weeks, update.total_delta)
+        players = _update_players(previous.players, update)
+    else:
+        standings, players = build_standings_cube(scores), _summarize_players(scores)
+
+    return SeasonModel(
+        key=key,
+        season=replace(season, picks={}, games={}),
+        scores=scores,
+        standings=standings,
+        players=players,
+    )
+
+
+def _summarize_players(overall_scores: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per player with season totals.
+    """
+    return (
+        overall_scores
+        .assign(**{"Total Points": pd.to_numeric(overall_scores["Total Points"], errors="coerce").fillna(0.0)})
+        .groupby("Player", sort=False, observed=True)
+        .agg(**{
+            "Total Points": ("Total Points", "sum"),
+            "Survivor Correct": ("Survivor Point", "sum"),
+            "Specials": ("Special", "sum"),
+            "Weeks": ("Week", "nunique"),
+        })
+    )
+
+
+def _update_players(players: pd.DataFrame, update: LiveUpdate) -> pd.DataFrame:
+    """
+    Applies a live rescore to the per-player summary.
+    """
+    deltas = (
+        pd.DataFrame({
+            "Total Points": update.total_delta,
+            "Survivor Correct": update.survivor_delta,
+            "Specials": update.special_delta,
+        }, index=pd.Index(update.players, name="Player"))
+        .groupby(level=0)
+        .sum()
+    )
+    updated = players.copy()
+    updated.loc[deltas.index, deltas.columns] += deltas.to_numpy()
+    return updated
+
+
+@st.cache_resource(max_entries=4)
+def _cached_contrarian(key: tuple, through_week: int, _season_model: SeasonModel) -> pd.DataFrame:
+    return build_contrarian(_season_model.scores, _season_model.season.outcomes, through_week)
+
+
+@st.cache_resource
+def _season_model_store() -> SeasonModelStore:
+    return SeasonModelStore()
+
+
+def get_season_model(app_config: dict) -> SeasonModel:
+    """
+    Returns the process-wide season snapshot, rebuilding it if the data changed.
+    """
+    return _season_model_store().get(app_config)
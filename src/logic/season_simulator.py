@@ -0,0 +1,392 @@
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# local imports
+from src.utils.season_schema import PICK_COLS, SPREAD_WEIGHTS
+from .season_model import SeasonModel
+
+TRIMESTERS = {
+    "Trimester 1": (1, 6),
+    "Trimester 2": (7, 12),
+    "Trimester 3": (13, 18),
+}
+TOP_N = 10
+MARGIN_SD = 13.5  # std. dev. of the final margin around the spread (points)
+CHUNK_CELLS = 16_000_000  # (cell, sim) values held in memory per chunk
+
+@dataclass(frozen=True)
+class SimulationInputs:
+    """
+    Everything a simulation chunk needs, as plain arrays (picklable for
+    worker processes).
+
+    Picks whose games are all final are already folded into the fixed
+    totals; every other submitted pick is rescored against simulated
+    outcomes, and player-weeks without picks in unfinished weeks are
+    sampled from the league's pick distribution.
+
+    Attributes:
+        players (np.ndarray): Player names, one per row of the results.
+        fixed_points (np.ndarray): Decided points, shape (players, trimesters).
+        fixed_specials (np.ndarray): Decided Specials per player.
+        win (np.ndarray): Known game winners by [week, team_id].
+        base_points (np.ndarray): Known spread base points by [week, team_id].
+        has_game (np.ndarray): Team plays that week, by [week, team_id].
+        game_week (np.ndarray): Week of each unplayed game.
+        game_home (np.ndarray): Home team ID of each unplayed game.
+        game_away (np.ndarray): Away team ID of each unplayed game.
+        game_spread (np.ndarray): Home spread of each unplayed game (0 if missing).
+        open_player (np.ndarray): Player of each undecided submitted pick row.
+        open_week (np.ndarray): Week of each undecided submitted pick row.
+        open_codes (np.ndarray): Team IDs of each undecided row, shape (rows, len(PICK_COLS)).
+        sample_player (np.ndarray): Player of each player-week to sample.
+        sample_week (np.ndarray): Week of each player-week to sample.
+        pick_cdf (np.ndarray): Cumulative league pick share of each team per
+            pick slot among the teams playing, shape (len(PICK_COLS), weeks + 1, teams).
+    """
+    players: np.ndarray
+    fixed_points: np.ndarray
+    fixed_specials: np.ndarray
+    win: np.ndarray
+    base_points: np.ndarray
+    has_game: np.ndarray
+    game_week: np.ndarray
+    game_home: np.ndarray
+    game_away: np.ndarray
+    game_spread: np.ndarray
+    open_player: np.ndarray
+    open_week: np.ndarray
+    open_codes: np.ndarray
+    sample_player: np.ndarray
+    sample_week: np.ndarray
+    pick_cdf: np.ndarray
+
+
+def build_simulation_inputs(season_model: SeasonModel) -> SimulationInputs:
+    """
+    Splits the season into decided points, undecided picks and missing picks.
+    """
+    scores = season_model.scores
+    outcomes = season_model.season.outcomes
+    players = season_model.standings.players
+    num_weeks = outcomes.num_weeks
+
+    # every submitted pick as team IDs (rows without a known player are dropped;
+    # get_indexer marks them -1, which would index the last player)
+    player = season_model.standings.index.get_indexer(scores["Player"].to_numpy())
+    known = player >= 0
+    scores, player = scores.loc[known], player[known]
+    week = scores["Week"].to_numpy(dtype=np.intp)
+    codes = outcomes.teams.encode(scores[PICK_COLS].to_numpy(dtype=object)).astype(np.intp)
+
+    # a row is decided once none of its picks has a game left to play
+    decided = (outcomes.final[week[:, None], codes] | ~outcomes.has_game[week[:, None], codes]).all(axis=1)
+    trimester = _trimester_of(week)
+    fixed_points = np.zeros((len(players), len(TRIMESTERS)))
+    np.add.at(fixed_points, (player[decided], trimester[decided]), scores["Total Points"].to_numpy(dtype=float)[decided])
+    fixed_specials = np.bincount(player[decided], weights=scores["Special"].to_numpy(dtype=float)[decided], minlength=len(players))
+
+    # unplayed games (missing spreads are treated as pick'em)
+    unplayed = ~outcomes.final & outcomes.has_game & outcomes.is_home
+    game_week, game_home = np.nonzero(unplayed)
+    game_away = outcomes.opponent[game_week, game_home].astype(np.intp)
+    game_spread = np.nan_to_num(outcomes.spread[game_week, game_home], nan=0.0)
+
+    # player-weeks without picks in weeks that still have games to play
+    open_weeks = np.flatnonzero(unplayed.any(axis=1))
+    submitted = np.zeros((len(players), num_weeks + 1), dtype=bool)
+    submitted[player, week] = True
+    sample_player, sample_week = np.nonzero(~submitted[:, open_weeks])
+    sample_week = open_weeks[sample_week]
+
+    # league pick share per slot (add-one smoothed), limited to each week's games
+    num_teams = len(outcomes.teams)
+    pick_share = np.ones((len(PICK_COLS), num_teams + 1))
+    for slot in range(len(PICK_COLS)):
+        np.add.at(pick_share[slot], codes[:, slot], 1.0)
+    pick_share = pick_share[:, None, :num_teams] * outcomes.has_game[None, :, :num_teams]
+    pick_cdf = np.cumsum(pick_share, axis=2) / np.maximum(pick_share.sum(axis=2, keepdims=True), 1e-12)
+
+    return SimulationInputs(
+        players=players,
+        fixed_points=fixed_points,
+        fixed_specials=fixed_specials,
+        win=outcomes.game_winner,
+        base_points=outcomes.base_points,
+        has_game=outcomes.has_game,
+        game_week=game_week,
+        game_home=game_home,
+        game_away=game_away,
+        game_spread=game_spread.astype(float),
+        open_player=player[~decided],
+        open_week=week[~decided],
+        open_codes=codes[~decided],
+        sample_player=sample_player,
+        sample_week=sample_week,
+        pick_cdf=pick_cdf,
+    )
+
+
+def simulate_season(
+    inputs: SimulationInputs,
+    n_sims: int = 100_000,
+    processes: int = 0,
+    seed: int = 0
+) -> pd.DataFrame:
+    """
+    Plays out the rest of the season n_sims times.
+
+    Each unplayed game's home margin is drawn from a normal distribution
+    centred on the spread (rounded to whole points, so ties and pushes can
+    happen), and every pick is scored with the normal rules. Simulations
+    are vectorized in chunks; with processes > 0 the chunks are spread over
+    a pool of spawned (not forked) processes, since the app server is
+    multi-threaded. Missing picks are redrawn for every chunk. Results only
+    depend on the seed, not on the pool size.
+
+    Returns:
+        pd.DataFrame: One row per player with the probability of finishing in
+            the top 10 overall, winning each trimester (ties split the win) and
+            earning the Special prize (at least one Special).
+    """
+    cells_per_sim = (len(inputs.sample_player) + len(inputs.open_player)) * len(PICK_COLS) + 2 * inputs.win.size
+    chunk = max(1, min(n_sims, CHUNK_CELLS // cells_per_sim))
+    sizes = [chunk] * (n_sims // chunk) + ([n_sims % chunk] if n_sims % chunk else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if not len(inputs.players):
+        results = []
+    elif processes > 0 and len(sizes) > 1:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(processes, len(sizes)), mp_context=context) as pool:
+            results = list(pool.map(_simulate_chunk, [inputs] * len(sizes), sizes, seeds))
+    else:
+        results = [_simulate_chunk(inputs, size, s) for size, s in zip(sizes, seeds)]
+    top_n, trimester_wins, special_wins = (sum(parts) / n_sims for parts in zip(*results)) if results else (
+        np.zeros(0), np.zeros((0, len(TRIMESTERS))), np.zeros(0)
+    )
+
+    projections = pd.DataFrame({
+        "Player": inputs.players,
+        "Current Points": inputs.fixed_points.sum(axis=1),
+        f"Top {TOP_N}": top_n,
+        **{name: trimester_wins[:, i] for i, name in enumerate(TRIMESTERS)},
+        "Special": special_wins,
+    })
+    return projections.sort_values([f"Top {TOP_N}", "Current Points"], ascending=False, ignore_index=True)
+
+
+def _simulate_chunk(
+    inputs: SimulationInputs,
+    n_sims: int,
+    seed: np.random.SeedSequence
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simulates n_sims seasons and counts top-N finishes and prize wins.
+
+    Outcome tables are laid out (week x team cell, sim) so scoring a pick is
+    a contiguous row gather across every simulation at once, and points are
+    kept as whole half-points in small integers.
+    """
+    rng = np.random.default_rng(seed)
+    num_players, num_trimesters = inputs.fixed_points.shape
+    num_cols = inputs.win.shape[1]
+    weights = np.fromiter(SPREAD_WEIGHTS.values(), dtype=np.uint8)
+
+    # simulate unplayed games: (games, sims) home margins
+    margin = np.rint(rng.normal(-inputs.game_spread[:, None], MARGIN_SD, (len(inputs.game_spread), n_sims)))
+    cover = margin + inputs.game_spread[:, None]
+    home = inputs.game_week * num_cols + inputs.game_home
+    away = inputs.game_week * num_cols + inputs.game_away
+    win = np.repeat(inputs.win.reshape(-1, 1), n_sims, axis=1)
+    half_points = np.repeat((2 * inputs.base_points).reshape(-1, 1).astype(np.uint8), n_sims, axis=1)
+    win[home], win[away] = margin > 0, margin < 0
+    half_points[home] = np.where(cover == 0, 1, 2 * (cover > 0))
+    half_points[away] = np.where(cover == 0, 1, 2 * (cover < 0))
+
+    # missing picks, drawn once per chunk from the league's pick share
+    # among the teams playing that week
+    cdf = inputs.pick_cdf[:, inputs.sample_week].transpose(1, 0, 2)
+    draws = rng.random((len(inputs.sample_week), len(PICK_COLS), 1))
+    sampled = (draws > cdf).sum(axis=2)
+
+    # undecided and sampled picks, grouped by (player, trimester)
+    # (an unknown team, -1, lands on the previous row's empty last column)
+    player = np.concatenate([inputs.open_player, inputs.sample_player])
+    week = np.concatenate([inputs.open_week, inputs.sample_week])
+    group = player * num_trimesters + _trimester_of(week)
+    order = np.argsort(group, kind="stable")
+    player, group = player[order], group[order]
+    cells = (week[:, None] * num_cols + np.concatenate([inputs.open_codes, sampled]))[order]
+
+    # score every row across all sims: (rows, sims)
+    survivor = win[cells[:, 0]]
+    spread_total = half_points[cells[:, 1]] * weights[0]
+    for i in range(1, len(weights)):
+        spread_total += half_points[cells[:, i + 1]] * weights[i]
+    total = survivor * spread_total
+    special_row, special_sim = np.nonzero((spread_total == 2 * weights.sum()) & ~survivor)
+
+    # sum rows into (player, trimester, sims) and (player, sims)
+    points = _sum_sorted_rows(total, group, num_players * num_trimesters).reshape(num_players, num_trimesters, n_sims)
+    points = points + np.rint(2 * inputs.fixed_points).astype(np.int32)[:, :, None]
+    specials = np.repeat(inputs.fixed_specials.astype(np.int32)[:, None], n_sims, axis=1)
+    np.add.at(specials, (player[special_row], special_sim), 1)  # Specials are rare
+
+    # final standings
+    season = points.sum(axis=1)
+    nth = min(TOP_N, num_players) - 1
+    cutoff = -np.partition(-season, nth, axis=0)[nth]
+    top_n = (season >= cutoff).sum(axis=1)
+    trimester_wins = np.stack([_share_of_wins(points[:, i]) for i in range(num_trimesters)], axis=1)
+    special_wins = (specials > 0).sum(axis=1)
+
+    return top_n, trimester_wins, special_wins
+
+
+def _sum_sorted_rows(values: np.ndarray, groups: np.ndarray, num_groups: int) -> np.ndarray:
+    """
+    Sums (rows, sims) values into (num_groups, sims), rows sorted by group.
+
+    Groups are small (a player's weeks), so rows are added one position
+    within the group at a time, which is far faster than np.add.reduceat
+    over many short segments.
+    """
+    sums = np.zeros((num_groups, values.shape[1]), dtype=np.int16)
+    if not len(groups):
+        return sums
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    ends = np.r_[starts[1:], len(groups)]
+    group_sums = np.zeros((len(starts), values.shape[1]), dtype=np.int16)
+    for depth in range(int((ends - starts).max())):
+        present = starts + depth < ends
+        group_sums[present] += values[starts[present] + depth]
+    sums[groups[starts]] = group_sums
+    return sums
+
+
+def _share_of_wins(values: np.ndarray) -> np.ndarray:
+    """
+    Per-player wins over (players, sims) values, splitting ties for the best
+    value. Sims where nobody has a positive value award nothing.
+    """
+    best = values.max(axis=0)
+    winners = (values == best) & (best > 0)
+    return (winners / np.maximum(winners.sum(axis=0), 1)).sum(axis=1)
+
+
+def _trimester_of(week: np.ndarray) -> np.ndarray:
+    """
+    Trimester index (0-based) of each week.
+    """
+    starts = np.array([start for start, _ in TRIMESTERS.values()])
+    return np.clip(np.searchsorted(starts, week, side="right") - 1, 0, len(starts) - 1)
+
+
+class ProjectionStore:
+    """
+    Holds the latest season projections and recomputes them in the background.
+
+    Projections are keyed on the content of the simulation inputs, so a
+    data refresh that leaves scores and games unchanged (e.g. the player
+    pool or logos sheet) reuses them. Only the first request waits for a
+    simulation. When the inputs change (e.g. a live-score refresh), one
+    background run starts and the previous projections keep being served
+    until it finishes, so a refresh never blocks the page.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._first_run = threading.Lock()
+        self._inputs: tuple[tuple, SimulationInputs, str] | None = None
+        self._latest: tuple[tuple, pd.DataFrame] | None = None
+        self._pending: tuple | None = None
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="projections")
+
+    def get(self, season_model: SeasonModel, n_sims: int, processes: int) -> tuple[pd.DataFrame, bool]:
+        """
+        Returns the projections and whether they are for this season model
+        (False while newer ones are still being simulated).
+        """
+        inputs, content = self._prepare(season_model)
+        key = (content, n_sims, processes)
+        with self._lock:
+            if self._latest is not None:
+                if self._latest[0] != key and self._pending != key:
+                    self._pending = key
+                    self._worker.submit(self._run, key, inputs, n_sims, processes)
+                return self._latest[1], self._latest[0] == key
+
+        # nothing to serve yet: simulate in this request (once for all sessions)
+        with self._first_run:
+            if self._latest is None:
+                with st.spinner("Simulating the rest of the season..."):
+                    projections = simulate_season(inputs, n_sims, processes)
+                with self._lock:
+                    self._latest = (key, projections)
+        return self.get(season_model, n_sims, processes)
+
+    def _prepare(self, season_model: SeasonModel) -> tuple[SimulationInputs, str]:
+        """
+        Simulation inputs and their content hash, built once per season model.
+        """
+        with self._lock:
+            if self._inputs is not None and self._inputs[0] == season_model.key:
+                return self._inputs[1], self._inputs[2]
+        inputs = build_simulation_inputs(season_model)
+        content = _hash_inputs(inputs)
+        with self._lock:
+            self._inputs = (season_model.key, inputs, content)
+        return inputs, content
+
+    def _run(self, key: tuple, inputs: SimulationInputs, n_sims: int, processes: int):
+        # runs one at a time in request order, so each result is the newest
+        try:
+            projections = simulate_season(inputs, n_sims, processes)
+        except Exception:
+            with self._lock:
+                if self._pending == key:
+                    self._pending = None
+            raise
+        with self._lock:
+            self._latest = (key, projections)
+            if self._pending == key:
+                self._pending = None
+
+
+def _hash_inputs(inputs: SimulationInputs) -> str:
+    """
+    Content hash of the simulation inputs.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for field in fields(inputs):
+        values = getattr(inputs, field.name)
+        if values.dtype == object:
+            digest.update("\x1f".join(map(str, values)).encode())
+        else:
+            digest.update(str(values.shape).encode() + np.ascontiguousarray(values).tobytes())
+    return digest.hexdigest()
+
+
+@st.cache_resource
+def _projection_store() -> ProjectionStore:
+    return ProjectionStore()
+
+
+def get_projections(app_config: dict, season_model: SeasonModel) -> tuple[pd.DataFrame, bool]:
+    """
+    Returns the season projections and whether they are up to date with the
+    season model (see `ProjectionStore`).
+    """
+    config = app_config.get("simulation", {})
+    processes = config.get("processes", 0)
+    if processes < 0:
+        processes = os.cpu_count() or 1
+    return _projection_store().get(season_model, config.get("sims", 100_000), processes)
@@ -0,0 +1,233 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# local imports
+from src.utils.season_schema import MAX_WEEKLY_POINTS
+
+SEASON_WEEKS = 18
+
+@dataclass(frozen=True)
+class StandingsCube:
+    """
+    Player x week points matrix holding cumulative sums.
+
+    Column `w` of `points` holds each player's points through week `w`
+    (column 0 is all zeros), so any week range is a single subtraction.
+
+    Attributes:
+        players (np.ndarray): Player names, one per row.
+        name_order (np.ndarray): Case-insensitive alphabetical position of each player.
+        points (np.ndarray): Cumulative points, shape (players, weeks + 1).
+        played (np.ndarray): Cumulative count of scored weeks, shape (players, weeks + 1).
+        index (pd.Index): Player name -> row lookup.
+    """
+    players: np.ndarray
+    name_order: np.ndarray
+    points: np.ndarray
+    played: np.ndarray
+    index: pd.Index
+
+    @property
+    def num_weeks(self) -> int:
+        return self.points.shape[1] - 1
+
+    def totals(self, start_week: int, end_week: int) -> np.ndarray:
+        """
+        Points per player for weeks start_week..end_week (inclusive).
+        """
+        start, end = self._clip(start_week, end_week)
+        return self.points[:, end] - self.points[:, start - 1]
+
+    def standings(
+        self,
+        start_week: int,
+        end_week: int,
+        label: str,
+        open_weeks: np.ndarray | None = None,
+        positions: int | None = None
+    ) -> pd.DataFrame:
+        """
+        Ranked standings for weeks start_week..end_week (inclusive).
+
+        Only players with at least one scored week in the range are included.
+        Ties share the same (minimum) rank and are listed alphabetically.
+
+        If open_weeks and the number of payout positions are given, a Status
+        column flags players who have clinched a payout position or been
+        eliminated from all of them (see `rank_bounds`).
+        """
+        start, end = self._clip(start_week, end_week)
+        points = self.points[:, end] - self.points[:, start - 1]
+        present = np.flatnonzero(self.played[:, end] > self.played[:, start - 1])
+
+        # sort first by score (descending), then player (alphabetical)
+        points = points[present]
+        order = np.lexsort((self.name_order[present], -points))
+        rows, points = present[order], points[order]
+
+        # assign rank with ties handled
+        position = np.arange(1, len(points) + 1)
+        new_score = np.r_[True, points[1:] != points[:-1]] if len(points) else np.array([], dtype=bool)
+        rank = np.maximum.accumulate(np.where(new_score, position, 0))
+
+        standings = pd.DataFrame({
+            "Rank": rank.astype(int),
+            "Player": self.players[rows],
+            label: points,
+        })
+        if open_weeks is not None and positions is not None:
+            standings["Status"] = self.clinch_status(start, end, open_weeks, positions)[rows]
+        return standings
+
+    def as_of(self, week: int, label: str) -> pd.DataFrame:
+        """
+        Overall standings through the given week.
+        """
+        return self.standings(1, week, label)
+
+    def point_bounds(
+        self,
+        start_week: int,
+        end_week: int,
+        open_weeks: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Minimum and maximum points each player can finish weeks
+        start_week..end_week with.
+
+        Weeks flagged in open_weeks (indexed by week; weeks past its end count
+        as open) can still score anywhere from 0 to MAX_WEEKLY_POINTS, so
+        their current points are not counted towards the minimum.
+        """
+        start, end = self._clip(start_week, end_week)
+        weeks = np.arange(start, end + 1)
+        is_open = np.ones(len(weeks), dtype=bool)
+        known = weeks < len(open_weeks)
+        is_open[known] = np.asarray(open_weeks, dtype=bool)[weeks[known]]
+
+        weekly = self.points[:, start:end + 1] - self.points[:, start - 1:end]
+        minimum = weekly[:, ~is_open].sum(axis=1)
+        return minimum, minimum + MAX_WEEKLY_POINTS * is_open.sum()
+
+    def rank_bounds(
+        self,
+        start_week: int,
+        end_week: int,
+        open_weeks: np.ndarray,
+        positions: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Best and worst rank each player can still finish weeks
+        start_week..end_week with (ties share the minimum rank).
+
+        The best rank counts players guaranteed to finish strictly ahead and
+        the worst rank counts players who can still finish strictly ahead,
+        both with binary searches over the sorted bounds. If positions is
+        given, players whose best rank is already past it are pruned and get
+        a worst rank of len(players).
+        """
+        minimum, maximum = self.point_bounds(start_week, end_week, open_weeks)
+        num_players = len(minimum)
+
+        # players guaranteed ahead: minimum_j > maximum_i
+        best = 1 + num_players - np.searchsorted(np.sort(minimum), maximum, side="right")
+
+        # players that may still pass: maximum_j > minimum_i (j != i)
+        worst = np.full(num_players, num_players)
+        contenders = np.flatnonzero(best <= positions) if positions is not None else np.arange(num_players)
+        could_pass = num_players - np.searchsorted(np.sort(maximum), minimum[contenders], side="right")
+        worst[contenders] = 1 + could_pass - (maximum[contenders] > minimum[contenders])
+
+        return best, worst
+
+    def clinch_status(
+        self,
+        start_week: int,
+        end_week: int,
+        open_weeks: np.ndarray,
+        positions: int
+    ) -> np.ndarray:
+        """
+        Clinched / eliminated flag of each player for the top `positions`.
+
+        Players who cannot finish outside the top positions have clinched
+        ("Clinched 1st" or "Clinched top N" for their worst possible rank);
+        players who cannot reach them are "Eliminated". Others are blank.
+        """
+        best, worst = self.rank_bounds(start_week, end_week, open_weeks, positions)
+        status = np.full(len(best), "", dtype=object)
+        status[best > positions] = "Eliminated"
+        clinched = worst <= positions
+        status[clinched] = [f"Clinched top {rank}" if rank > 1 else "Clinched 1st" for rank in worst[clinched]]
+        return status
+
+    def apply_deltas(self, players: np.ndarray, weeks: np.ndarray, deltas: np.ndarray) -> "StandingsCube":
+        """
+        Returns a cube with per-(player, week) point changes applied.
+
+        Only the affected players' cumulative rows are recomputed; every other
+        row is copied unchanged and this cube is left as is.
+        """
+        # rows without a known player (-1) are dropped, as in build_standings_cube
+        rows = self.index.get_indexer(players)
+        known = rows >= 0
+        rows, weeks, deltas = rows[known], np.asarray(weeks)[known], np.asarray(deltas)[known]
+        affected, positions = np.unique(rows, return_inverse=True)
+
+        # rebuild weekly points for affected players, apply, re-accumulate
+        weekly = np.diff(self.points[affected], axis=1, prepend=0.0)
+        np.add.at(weekly, (positions, np.asarray(weeks, dtype=int)), deltas)
+        points = self.points.copy()
+        points[affected] = np.cumsum(weekly, axis=1)
+
+        return StandingsCube(
+            players=self.players,
+            name_order=self.name_order,
+            points=points,
+            played=self.played,
+            index=self.index,
+        )
+
+    def _clip(self, start_week: int, end_week: int) -> tuple[int, int]:
+        start = min(max(int(start_week), 1), self.num_weeks + 1)
+        end = min(max(int(end_week), start - 1), self.num_weeks)
+        return start, end
+
+
+def build_standings_cube(overall_scores: pd.DataFrame) -> StandingsCube:
+    """
+    Builds the cumulative player x week points matrix from overall_scores.
+    """
+    # player codes (rows without a player are dropped)
+    player_codes, players = pd.factorize(overall_scores["Player"], sort=False)
+    keep = player_codes >= 0
+    player_codes = player_codes[keep]
+    players = np.asarray(players, dtype=object)
+
+    # weeks + points (coerce for pushes)
+    weeks = pd.to_numeric(overall_scores["Week"], errors="coerce").to_numpy()[keep]
+    points = pd.to_numeric(overall_scores["Total Points"], errors="coerce").fillna(0.0).to_numpy(dtype=float)[keep]
+    valid = ~np.isnan(weeks)
+    player_codes, weeks, points = player_codes[valid], weeks[valid].astype(int), points[valid]
+    num_weeks = max(SEASON_WEEKS, int(weeks.max()) if len(weeks) else 0)
+
+    # player x week matrices
+    weekly_points = np.zeros((len(players), num_weeks + 1))
+    weekly_played = np.zeros((len(players), num_weeks + 1), dtype=np.int32)
+    np.add.at(weekly_points, (player_codes, weeks), points)
+    np.add.at(weekly_played, (player_codes, weeks), 1)
+
+    # case-insensitive alphabetical position of each player
+    lower_names = pd.Series(players, dtype=object).str.lower().to_numpy(dtype=str)
+    name_order = np.empty(len(players), dtype=np.int64)
+    name_order[np.argsort(lower_names, kind="stable")] = np.arange(len(players))
+
+    return StandingsCube(
+        players=players,
+        name_order=name_order,
+        points=np.cumsum(weekly_points, axis=1),
+        played=np.cumsum(weekly_played, axis=1),
+        index=pd.Index(players),
+    )
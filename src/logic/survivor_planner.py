@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# local imports
+from src.utils import OutcomeIndex, linear_sum_assignment
+from .season_model import SeasonModel
+from .season_simulator import MARGIN_SD
+
+OBJECTIVES = ("win_probability", "margin")
+
+def win_probability(spread: np.ndarray) -> np.ndarray:
+    """
+    Chance a team wins given its spread (negative when favored), with the
+    final margin normally distributed around the spread.
+    """
+    z = -np.asarray(spread, dtype=float) / (MARGIN_SD * math.sqrt(2))
+    return 0.5 * (1 + np.vectorize(math.erf, otypes=[float])(z))
+
+
+def plan_survivor_path(
+    outcomes: OutcomeIndex,
+    weeks: list[int],
+    teams: np.ndarray,
+    objective: str = "win_probability"
+) -> pd.DataFrame:
+    """
+    Best survivor pick for each remaining week, using every team at most once.
+
+    Solved as an assignment problem (weeks x unused teams) that maximizes
+    either the summed win probability (the expected number of survivor
+    points) or the summed favorite margin. Teams without a game that week
+    can't be picked; a missing spread counts as a pick'em. Weeks that can't
+    be filled are left out.
+
+    Returns:
+        pd.DataFrame: Week, Team, Opponent, Spread and Win Probability, one
+            row per planned week.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {OBJECTIVES}, got {objective!r}")
+
+    weeks, teams = np.asarray(weeks, dtype=int), np.asarray(teams, dtype=int)
+    has_game = outcomes.has_game[weeks[:, None], teams]
+    spread = np.nan_to_num(outcomes.spread[weeks[:, None], teams].astype(float), nan=0.0)
+    values = win_probability(spread) if objective == "win_probability" else -spread
+
+    # teams on a bye cost more than any real pick, so they are only used to fill
+    # weeks that can't be covered otherwise (and then dropped)
+    penalty = np.abs(values[has_game]).max(initial=0.0) * 2 + 1
+    rows, cols = linear_sum_assignment(np.where(has_game, -values, penalty))
+    keep = has_game[rows, cols]
+    rows, cols = rows[keep], cols[keep]
+
+    week, team = weeks[rows], teams[cols]
+    names = np.asarray(outcomes.teams.teams + (None,), dtype=object)
+    return pd.DataFrame({
+        "Week": week,
+        "Team": names[team],
+        "Opponent": names[outcomes.opponent[week, team]],
+        "Spread": outcomes.spread[week, team],
+        "Win Probability": win_probability(spread[rows, cols]),
+    })
+
+
+@st.cache_resource(max_entries=256)
+def _cached_plan(
+    key: tuple,
+    player: str,
+    used: tuple[str, ...],
+    weeks: tuple[int, ...],
+    objective: str,
+    _season_model: SeasonModel
+) -> pd.DataFrame:
+    season = _season_model.season
+    teams = np.setdiff1d(np.arange(len(season.teams)), season.teams.encode(list(used)))
+    return plan_survivor_path(season.outcomes, list(weeks), teams, objective)
+
+
+def get_survivor_plan(
+    season_model: SeasonModel,
+    player: str,
+    used: list[str],
+    weeks: list[int],
+    objective: str = "win_probability"
+) -> pd.DataFrame:
+    """
+    Returns the player's planned survivor path, cached per (player, data version).
+    """
+    return _cached_plan(season_model.key, player, tuple(used), tuple(weeks), objective, season_model)
@@ -0,0 +1,125 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# local imports
+from src.utils import TeamRegistry
+
+@dataclass(frozen=True)
+class SurvivorUsage:
+    """
+    Survivor teams each player has used, as bitmasks (bit t is team ID t).
+
+    Attributes:
+        teams (TeamRegistry): Registry the bits refer to.
+        players (np.ndarray): Player names, one per row.
+        index (pd.Index): Player name -> row lookup.
+        picks (np.ndarray): Survivor team ID per (player, week), -1 if none.
+        used (np.ndarray): Teams used through each week, shape (players, weeks + 1).
+    """
+    teams: TeamRegistry
+    players: np.ndarray
+    index: pd.Index
+    picks: np.ndarray
+    used: np.ndarray
+
+    @property
+    def all_teams(self) -> np.uint64:
+        return np.uint64((1 << len(self.teams)) - 1)
+
+    def used_through(self, week: int) -> np.ndarray:
+        """
+        Mask of teams each player has used in weeks 1..week.
+        """
+        return self.used[:, self._clip(week)]
+
+    def remaining_after(self, week: int) -> np.ndarray:
+        """
+        Mask of teams each player can still use after week.
+        """
+        return ~self.used_through(week) & self.all_teams
+
+    def duplicates(self) -> np.ndarray:
+        """
+        (player, week) flags for survivor picks of a team already used.
+        """
+        used_before = np.zeros_like(self.used)
+        used_before[:, 1:] = self.used[:, :-1]
+        return (_team_bits(self.picks) & used_before) != 0
+
+    def can_pick(self, team: int, week: int, through: int | None = None) -> np.ndarray:
+        """
+        Players who have not used the team before the given week, counting
+        only picks through week `through` (e.g. the last released week).
+        """
+        last = week - 1 if through is None else min(week - 1, through)
+        return ((self.used_through(last) >> np.uint64(team)) & np.uint64(1)) == 0
+
+    def availability(self, week: int) -> pd.DataFrame:
+        """
+        League-wide count of players who can still use each team after week.
+        """
+        remaining = self.remaining_after(week)
+        counts = self._unpack(remaining).sum(axis=0)
+        return pd.DataFrame({
+            "Team": self.teams.teams,
+            "Players": counts,
+            "Share": counts / max(len(self.players), 1),
+        })
+
+    def decode(self, mask: np.uint64) -> list[str]:
+        """
+        Team names in a mask, in registry order.
+        """
+        return [self.teams.teams[t] for t in np.flatnonzero(self._unpack(np.atleast_1d(mask))[0])]
+
+    def first_use_order(self, player: str, week: int) -> list[str]:
+        """
+        A player's used teams through week, in the order first picked.
+        """
+        picks = self.picks[self.index.get_loc(player), 1:self._clip(week) + 1]
+        picks = picks[picks >= 0]
+        _, first = np.unique(picks, return_index=True)
+        return [self.teams.teams[t] for t in picks[np.sort(first)]]
+
+    def _unpack(self, masks: np.ndarray) -> np.ndarray:
+        shifts = np.arange(len(self.teams), dtype=np.uint64)
+        return ((np.asarray(masks, dtype=np.uint64)[:, None] >> shifts) & np.uint64(1)).astype(bool)
+
+    def _clip(self, week: int) -> int:
+        return min(max(int(week), 0), self.used.shape[1] - 1)
+
+
+def build_survivor_usage(overall_scores: pd.DataFrame, teams: TeamRegistry, num_weeks: int) -> SurvivorUsage:
+    """
+    Builds every player's survivor usage masks from overall_scores.
+    """
+    if len(teams) > 64:
+        raise ValueError(f"at most 64 teams fit in a usage mask, got {len(teams)}")
+
+    player_codes, players = pd.factorize(overall_scores["Player"], sort=False)
+    players = np.asarray(players, dtype=object)
+    weeks = overall_scores["Week"].to_numpy(dtype=np.intp)
+    ids = teams.encode(overall_scores["Survivor Pick"].to_numpy(dtype=object))
+    keep = (player_codes >= 0) & (weeks >= 0) & (weeks <= num_weeks)
+
+    picks = np.full((len(players), num_weeks + 1), -1, dtype=np.int16)
+    picks[player_codes[keep], weeks[keep]] = ids[keep]
+
+    used = np.bitwise_or.accumulate(_team_bits(picks), axis=1)
+
+    return SurvivorUsage(
+        teams=teams,
+        players=players,
+        index=pd.Index(players),
+        picks=picks,
+        used=used,
+    )
+
+
+def _team_bits(ids: np.ndarray) -> np.ndarray:
+    """
+    One-hot bit of each team ID (0 for -1).
+    """
+    return np.where(ids >= 0, np.uint64(1) << np.maximum(ids, 0).astype(np.uint64), np.uint64(0))
@@ -1,8 +1,21 @@
-from .breakdown_page import breakdown_page
-from .matchups_and_spreads_page import matchups_and_spreads_page
-from .picks_page import picks_page
-from .prizes_page import prizes_page
-from .remaining_picks_page import remaining_picks_page
-from .rules_page import rules_page
-from .standings_page import standings_page
-from .summary_page import summary_page
\ No newline at end of file
+import importlib
+
+# page modules are imported lazily on first access (see registry.PAGES)
+__all__ = [
+    "breakdown_page",
+    "head_to_head_page",
+    "matchups_and_spreads_page",
+    "picks_page",
+    "prizes_page",
+    "projections_page",
+    "remaining_picks_page",
+    "rules_page",
+    "standings_page",
+    "summary_page",
+]
+
+def __getattr__(name: str):
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,19 +1,57 @@
 import pandas as pd
 import streamlit as st
 import re
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 # local imports
-from src.utils import calculate_week
+from src.logic import SeasonModel
+from src.utils import calculate_week, picks_released, released_through_week
 
 
-def breakdown_page(app_config: dict, overall_scores: pd.DataFrame):
+def breakdown_page(app_config: dict, season_model: SeasonModel):
     """
     Breakdown of spreads and survivor picks.
     """
     _inject_css()
-
+    _week_breakdown(season_model)
+
+    popularity = season_model.pick_popularity
+
+    # ---------- Row 3: season-wide consensus ----------
+    st.divider()
+    st.subheader("Season consensus")
+    tab_consensus, tab_contrarian = st.tabs(["Popular picks", "Contrarians"])
+
+    with tab_consensus:
+        st.caption("The league's most picked survivor and spread team each week, and the share of all spread picks that covered.")
+        consensus = popularity.consensus_by_week()
+        st.dataframe(
+            consensus.loc[consensus["Week"] <= released_through_week()],
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Survivor Share": st.column_config.NumberColumn(format="%.1f%%"),
+                "Spread Share": st.column_config.NumberColumn(format="%.1f%%"),
+                "League ATS %": st.column_config.NumberColumn(format="%.1f%%"),
+            },
+        )
+
+    with tab_contrarian:
+        st.caption("A fade is a spread pick on the side of a game the league picked less often. Only finished games count.")
+        st.dataframe(
+            season_model.contrarian(released_through_week()).sort_values(["Contrarian %", "Fades"], ascending=False),
+            use_container_width=True,
+            column_config={
+                "Contrarian %": st.column_config.NumberColumn(format="%.1f%%"),
+                "Fade Cover %": st.column_config.NumberColumn(format="%.1f%%"),
+            },
+        )
+
+
+@st.fragment
+def _week_breakdown(season_model: SeasonModel):
+    """
+    Week selector and that week's breakdowns; changing the week reruns only this.
+    """
     # ---------- Row 1: centered header + week selector ----------
     hdr_l, hdr_mid, hdr_r = st.columns([0.1, 1.0, 0.1])
 
@@ -25,65 +63,32 @@ def breakdown_page(app_config: dict, overall_scores: pd.DataFrame):
         week = int(re.search(r"\d+", week_choice).group())
 
     # ---------- Data load (not inside a narrow column) ----------
-    ET = ZoneInfo("America/New_York")
-    first_sunday = datetime(2025, 9, 7, 13, 0, 0, tzinfo=ET)  # CHANGE THIS if needed
-    picks_release_date = first_sunday + timedelta(weeks=week - 1)
-    current_time = datetime.now(ET)
-
     # gate: hide picks until kickoff
-    if current_time <= picks_release_date:
+    if not picks_released(week):
         with hdr_mid:
             st.caption("Picks released at kickoff of Sunday games.")
         return
 
-    # load weekly picks
-    sheet_id = app_config["data"]["picks"]["sheet_id"]
-    gid = app_config["data"]["picks"]["gid"][f"week{week}"]
-    url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
-    df = pd.read_csv(url)
-
-    picks_cols = [
-        "Survivor Pick",
-        "2 Point Spread",
-        "1 Point Spread (1)",
-        "1 Point Spread (2)",
-        "1 Point Spread (3)",
-        "1 Point Spread (4)",
-    ]
-    weekly_picks = (
-        df.copy()
-        .sort_values(by="Player", key=lambda c: c.str.strip().str.lower())
-        .set_index("Player")
-        .reindex(columns=picks_cols)
-    )
-
-    # prepare series for breakdowns
-    survivor_series = weekly_picks["Survivor Pick"] if "Survivor Pick" in weekly_picks.columns else pd.Series(dtype=str)
-
-    spread_cols = [
-        "2 Point Spread",
-        "1 Point Spread (1)",
-        "1 Point Spread (2)",
-        "1 Point Spread (3)",
-        "1 Point Spread (4)",
-    ]
-    existing_spread_cols = [c for c in spread_cols if c in weekly_picks.columns]
-    spread_series = weekly_picks[existing_spread_cols].stack(dropna=True) if existing_spread_cols else pd.Series(dtype=str)
+    # precomputed league counts (no per-week fetch)
+    popularity = season_model.pick_popularity
+    has_week = week < popularity.counts.shape[0]
+    survivor_counts = popularity.breakdown(week, survivor=True) if has_week else pd.DataFrame()
+    spread_counts = popularity.breakdown(week, survivor=False) if has_week else pd.DataFrame()
 
     # ---------- Row 2: two wide columns for the breakdowns ----------
     col_left, col_right = st.columns([0.5, 0.5], gap="large")
 
     with col_left:
         st.subheader("Survivor breakdown")
-        if not survivor_series.empty:
-            _breakdown_table(survivor_series, "Survivor picks", chart = False, type = "Survivor")
+        if not survivor_counts.empty:
+            _breakdown_table(survivor_counts, "Survivor picks", chart = False, type = "Survivor")
         else:
             st.caption("No survivor picks available for this week.")
 
     with col_right:
         st.subheader("Spread breakdown")
-        if not spread_series.empty:
-            _breakdown_table(spread_series, "spread picks", chart = False, type = "Spread")
+        if not spread_counts.empty:
+            _breakdown_table(spread_counts, "spread picks", chart = False, type = "Spread")
         else:
             st.caption("No spread picks available for this week.")
 
@@ -110,19 +115,11 @@ def _inject_css():
     )
 
 
-def _breakdown_table(series: pd.Series, label: str, chart: bool, type: str):
-    if series.empty:
+def _breakdown_table(counts: pd.DataFrame, label: str, chart: bool, type: str):
+    if counts.empty:
         st.caption(f"No {label.lower()} available for this week.")
         return
 
-    counts = (
-        series.dropna().astype(str).str.strip().str.upper()
-        .value_counts()
-        .rename_axis("Team").reset_index(name="Picks")
-    )
-    total = counts["Picks"].sum()
-    counts["%"] = (counts["Picks"] / total * 100).round(1)
-
     if type == "Survivor":
         height_dim = 500
     else:
@@ -136,6 +133,7 @@ def _breakdown_table(series: pd.Series, label: str, chart: bool, type: str):
             "Team": st.column_config.Column(width=70),
             "Picks": st.column_config.NumberColumn(format="%d", width=70),
             "%": st.column_config.NumberColumn(format="%.1f%%", width=80),
+            "Result": st.column_config.Column(width=80),
         },
         height=min(height_dim, 62 + 30 * len(counts)),
     )
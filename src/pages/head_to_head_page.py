@@ -0,0 +1,100 @@
+import pandas as pd
+import streamlit as st
+
+# local imports
+from src.utils import released_through_week
+from src.utils.season_schema import PICK_COLS
+from src.logic import PickOverlap, SeasonModel, get_pick_overlap
+
+def head_to_head_page(app_config: dict, season_model: SeasonModel):
+    """
+    Compares two players' picks: shared picks, splits and who won them.
+    """
+    left, mid, right = st.columns([0.1, 1.0, 0.1])
+    with mid:
+        st.title("Head to Head")
+
+    players = season_model.player_directory.names
+    if len(players) < 2:
+        st.info("Head to head needs at least two players.")
+        return
+
+    # current week's picks don't count until kickoff
+    through_week = released_through_week()
+
+    overlap = get_pick_overlap(season_model, through_week)
+    _compare_players(season_model, overlap, through_week)
+
+
+@st.fragment
+def _compare_players(season_model: SeasonModel, overlap: PickOverlap, through_week: int):
+    """
+    Player selectors and their comparison; changing a player reruns only this.
+    """
+    players = season_model.player_directory.names
+    left, mid, right = st.columns([0.1, 1.0, 0.1])
+    with mid:
+        c1, c2 = st.columns(2)
+        player_a = c1.selectbox("Player", options=players, index=0, placeholder="Type to search...")
+        player_b = c2.selectbox("Opponent", options=players, index=1, placeholder="Type to search...")
+    if not player_a or not player_b:
+        return
+
+    with mid:
+        st.caption(f"Picks through week {through_week}. Splits are games where the two took opposite sides; wins count finished games only.")
+        if player_a == player_b:
+            st.info("Pick two different players to compare.")
+        else:
+            h2h = overlap.head_to_head(player_a, player_b)
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("Similarity", f"{h2h['Similarity'] * 100:.1f}%")
+            c2.metric("Shared Spread Picks", h2h["Spread Shared"])
+            c3.metric("Shared Survivor Picks", h2h["Survivor Shared"])
+            c4.metric("Spread Splits", h2h["Spread Splits"])
+            c1, c2 = st.columns(2)
+            c1.metric(f"{player_a} split record", f"{h2h['Split Wins']}-{h2h['Split Losses']}")
+            c2.metric("Survivor split record", f"{h2h['Survivor Wins']}-{h2h['Survivor Losses']}")
+
+            st.subheader("Week by week")
+            st.dataframe(
+                _weekly_picks(season_model, player_a, player_b, through_week),
+                use_container_width=True,
+                hide_index=True,
+            )
+
+        st.subheader(f"Most similar to {player_a}")
+        st.dataframe(
+            overlap.most_similar(player_a),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Similarity": st.column_config.ProgressColumn(format="percent", min_value=0.0, max_value=1.0),
+            },
+        )
+
+
+def _weekly_picks(season_model: SeasonModel, player_a: str, player_b: str, through_week: int) -> pd.DataFrame:
+    """
+    Both players' survivor and spread picks side by side, one row per week.
+    """
+    def picks(player: str) -> pd.DataFrame:
+        df = season_model.player_scores(player)
+        df = df.loc[df["Week"] <= through_week]
+        spreads = df[PICK_COLS[1:]].astype(object)
+        return pd.DataFrame({
+            "Week": df["Week"].astype(int).to_numpy(),
+            "Survivor": df["Survivor Pick"].astype(object).to_numpy(),
+            "Spreads": [set(row) - {None} for row in spreads.where(spreads.notna(), None).to_numpy()],
+        })
+
+    weekly = picks(player_a).merge(picks(player_b), on="Week", how="outer", suffixes=(" A", " B")).sort_values("Week")
+    shared = [len(a & b) if isinstance(a, set) and isinstance(b, set) else 0
+              for a, b in zip(weekly["Spreads A"], weekly["Spreads B"])]
+    return pd.DataFrame({
+        "Week": weekly["Week"],
+        f"{player_a} Survivor": weekly["Survivor A"],
+        f"{player_b} Survivor": weekly["Survivor B"],
+        f"{player_a} Spreads": [", ".join(sorted(s)) if isinstance(s, set) else "" for s in weekly["Spreads A"]],
+        f"{player_b} Spreads": [", ".join(sorted(s)) if isinstance(s, set) else "" for s in weekly["Spreads B"]],
+        "Shared": shared,
+    })
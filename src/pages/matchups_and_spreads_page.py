@@ -4,77 +4,14 @@ import numpy as np
 import re
 
 # local imports
-from src.utils import calculate_week, load_yaml
+from src.utils import TableSpec, calculate_week, get_logo_assets, render_table
 
-def matchups_and_spreads_page(app_config: dict):
+MATCHUPS_TABLE = TableSpec(table_class="matchups", th_style="padding: 6px 12px")
+
+def matchups_and_spreads_page(app_config: dict, games: pd.DataFrame):
     """
     Displays weekly matchups in a clean, compact table (no scroll box).
     """
-    # page centering
-    left, mid, right = st.columns([0.35, 0.85, 0.35])
-
-    # determine which week
-    current_week = calculate_week()
-    weeks = [f"Week {i}" for i in range(1, 19)]
-
-    with mid:
-        st.title(f"Matchups and Spreads")
-        week_choice = st.selectbox("Select Week", weeks, index=17)
-        week = int(re.search(r"\d+", week_choice).group())
-
-    # load schedule
-    sheet_id = app_config["data"]["games"]["sheet_id"]
-    gid = app_config["data"]["games"]["gid"] 
-    csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
-    schedule_data = pd.read_csv(csv_url)
-
-    # subset data
-    schedule_data = schedule_data.loc[schedule_data["Week"] == week, :]
-    needed_cols = ["Weekday", "Kickoff Time", "Away Team", "Home Team", "Home Spread"]
-    schedule_data = schedule_data.loc[:, needed_cols].copy()
-
-    # format spread data
-    sp = pd.to_numeric(schedule_data["Home Spread"], errors="coerce")
-    schedule_data["Spread"] = np.where(
-        sp.isna(),
-        "Spreads Not Released",
-        np.where(
-            sp < 0,
-            schedule_data["Away Team"] + " +" + (-sp).round(1).astype(str) + " | " + schedule_data["Home Team"] + " " + sp.round(1).astype(str),
-            schedule_data["Away Team"] + " " + (-sp).round(1).astype(str) + " | " + schedule_data["Home Team"] + " +" + sp.round(1).astype(str),
-        ),
-    )
-
-    # game time variable
-    schedule_data["Kickoff Time"] = pd.to_datetime(
-        schedule_data["Kickoff Time"], format="%H:%M"
-    ).dt.strftime("%I:%M %p").str.lstrip("0")
-    schedule_data["Game Time"] = schedule_data["Weekday"].astype(str) + " - " + schedule_data["Kickoff Time"].astype(str)
-
-    # map logos
-    team_logos = load_yaml(app_config["config"]["logos"])
-    schedule_data["Away Logo"] = schedule_data["Away Team"].map(team_logos)
-    schedule_data["Home Logo"] = schedule_data["Home Team"].map(team_logos)
-
-    def img(url, height=140):
-        if pd.isna(url) or not url:
-            return ""
-        return f"<img src='{url}' style='height:{height}px;'>"
-    
-    display_df = schedule_data.loc[:, ["Game Time", "Away Logo", "Home Logo", "Spread"]].copy()
-    display_df["Away"] = display_df["Away Logo"].map(lambda u: img(u, height=40))
-    display_df["Home"] = display_df["Home Logo"].map(lambda u: img(u, height=40))
-    display_df = display_df.drop(columns=["Away Logo", "Home Logo"])
-    display_df = display_df[["Game Time", "Away", "Home", "Spread"]]
-
-    # badge-ify spread column
-    def spread_badge(s):
-        if s == "Spreads Not Released":
-            return "<span class='badge badge-muted'>Spreads Not Released</span>"
-        return f"<span class='badge'>{s}</span>"
-
-    display_df["Spread"] = display_df["Spread"].map(spread_badge)
-
     # CSS that makes it feel like a UI component (rounded, zebra, hover)
     st.markdown(
         """
@@ -168,15 +105,79 @@ def matchups_and_spreads_page(app_config: dict):
         unsafe_allow_html=True
     )
 
+    _weekly_matchups(app_config, games)
+
 
-    # style with pandas (just to hide index)
-    styled = (
-        display_df.style
-            .hide(axis="index")
-            .set_table_styles([{"selector": "th", "props": [("padding", "6px 12px")]}])
+@st.fragment
+def _weekly_matchups(app_config: dict, games: pd.DataFrame):
+    """
+    Week selector and matchups table; changing the week reruns only this.
+    """
+    # page centering
+    left, mid, right = st.columns([0.35, 0.85, 0.35])
+
+    # determine which week
+    current_week = calculate_week()
+    weeks = [f"Week {i}" for i in range(1, 19)]
+
+    with mid:
+        st.title(f"Matchups and Spreads")
+        week_choice = st.selectbox("Select Week", weeks, index=17)
+        week = int(re.search(r"\d+", week_choice).group())
+
+    # load schedule
+    schedule_data = games.loc[games["Week"] == week, :]
+
+    # subset data
+    needed_cols = ["Weekday", "Kickoff Time", "Away Team", "Home Team", "Home Spread"]
+    schedule_data = schedule_data.loc[:, needed_cols].copy()
+
+    # format spread data
+    sp = pd.to_numeric(schedule_data["Home Spread"], errors="coerce")
+    schedule_data["Spread"] = np.where(
+        sp.isna(),
+        "Spreads Not Released",
+        np.where(
+            sp < 0,
+            schedule_data["Away Team"] + " +" + (-sp).round(1).astype(str) + " | " + schedule_data["Home Team"] + " " + sp.round(1).astype(str),
+            schedule_data["Away Team"] + " " + (-sp).round(1).astype(str) + " | " + schedule_data["Home Team"] + " +" + sp.round(1).astype(str),
+        ),
     )
 
+    # game time variable
+    schedule_data["Kickoff Time"] = pd.to_datetime(
+        schedule_data["Kickoff Time"], format="%H:%M"
+    ).dt.strftime("%I:%M %p").str.lstrip("0")
+    schedule_data["Game Time"] = schedule_data["Weekday"].astype(str) + " - " + schedule_data["Kickoff Time"].astype(str)
+
+    # map logos (small local copies, inlined as data URIs)
+    team_logos = get_logo_assets(app_config)
+    schedule_data["Away Logo"] = schedule_data["Away Team"].map(team_logos)
+    schedule_data["Home Logo"] = schedule_data["Home Team"].map(team_logos)
+
+    def img(url, height=140):
+        if pd.isna(url) or not url:
+            return ""
+        return f"<img src='{url}' style='height:{height}px;'>"
+    
+    display_df = schedule_data.loc[:, ["Game Time", "Away Logo", "Home Logo", "Spread"]].copy()
+    display_df["Away"] = display_df["Away Logo"].map(lambda u: img(u, height=40))
+    display_df["Home"] = display_df["Home Logo"].map(lambda u: img(u, height=40))
+    display_df = display_df.drop(columns=["Away Logo", "Home Logo"])
+    display_df = display_df[["Game Time", "Away", "Home", "Spread"]]
+
+    # badge-ify spread column
+    def spread_badge(s):
+        if s == "Spreads Not Released":
+            return "<span class='badge badge-muted'>Spreads Not Released</span>"
+        return f"<span class='badge'>{s}</span>"
+
+    display_df["Spread"] = display_df["Spread"].map(spread_badge)
+
+    # plain HTML table (memoized per week's rows)
+    html = render_table(display_df, MATCHUPS_TABLE)
+
     with mid:
         st.caption("Note: All times are in Eastern Time.")
-        st.markdown(f"<div class='matchups'>{styled.to_html()}</div>", unsafe_allow_html=True)
+        st.markdown(html, unsafe_allow_html=True)
         st.caption("Spreads are updated around **1:30 PM Eastern Time on Thursdays**.")
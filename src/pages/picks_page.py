@@ -1,23 +1,32 @@
 import streamlit as st
 import pandas as pd
 from pathlib import Path
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 import re
 import numpy as np
 
 # local imports
-from src.utils import calculate_week
+from src.utils import calculate_week, load_picks, paginate, picks_released
+from src.logic import SeasonModel
 
+PAGE_SIZE = 100
 
-def picks_page(app_config: dict, overall_scores: pd.DataFrame):
+
+def picks_page(app_config: dict, season_model: SeasonModel):
     """
     Show weekly picks with simple correctness coloring driven by overall_scores:
       - 1 => green
       - 0 => red
     """
     _inject_css()
+    _weekly_picks(app_config, season_model)
+
 
+@st.fragment
+def _weekly_picks(app_config: dict, season_model: SeasonModel):
+    """
+    Week selector and picks table; changing the week or page reruns only this.
+    """
+    overall_scores = season_model.scores
     left, mid, right = st.columns([0.35, 1.0, 0.35])
 
     # --- week selector ---
@@ -28,19 +37,10 @@ def picks_page(app_config: dict, overall_scores: pd.DataFrame):
         week_choice = st.selectbox("Select Week", weeks, index=current_week - 1)
         week = int(re.search(r"\d+", week_choice).group())
 
-        # --- gating (hide picks until Sunday kickoff) ---
-        ET = ZoneInfo("America/New_York")
-        first_sunday = datetime(2025, 9, 7, 13, 0, 0, tzinfo=ET)  # CHANGE THIS if needed
-        picks_release_date = first_sunday + timedelta(weeks=week - 1)
-        current_time = datetime.now(ET)
-
-        # --- load weekly picks (Google Sheet) ---
+        # --- load weekly picks (Google Sheet), hidden until Sunday kickoff ---
         weekly_picks = pd.DataFrame()
-        if current_time > picks_release_date:
-            sheet_id = app_config["data"]["picks"]["sheet_id"]
-            gid = app_config["data"]["picks"]["gid"][f"week{week}"]
-            url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
-            df = pd.read_csv(url)
+        if picks_released(week):
+            df = load_picks(app_config, week)
 
             picks_cols = [
                 "Survivor Pick",
@@ -125,7 +125,10 @@ def picks_page(app_config: dict, overall_scores: pd.DataFrame):
             ],
         ]
         pick_cols_only = [c for c in weekly_picks.columns if c in col_map]
-        styled = weekly_picks.style.apply(apply_mask, subset=pick_cols_only, axis=None)
+
+        # only the visible window is styled and sent to the browser
+        window = paginate(weekly_picks.reset_index(), key="picks", page_size=PAGE_SIZE).set_index("Player")
+        styled = window.style.apply(apply_mask, subset=pick_cols_only, axis=None)
 
         # ---- NEW row: table on the left, survivor breakdown on the right ----
         # table_col, side_col = st.columns([0.72, 0.28], gap="large")
@@ -135,7 +138,7 @@ def picks_page(app_config: dict, overall_scores: pd.DataFrame):
         st.dataframe(
             styled.format(na_rep=""),
             use_container_width=True,  # fills the table column only
-            height=min(780, 46 + 34 * len(weekly_picks)),
+            height=min(780, 46 + 34 * len(window)),
             column_config={
                 "Total Points": st.column_config.NumberColumn(format="%.1f", width=90),
                 "Survivor Pick": st.column_config.Column(width=90),
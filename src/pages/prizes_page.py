@@ -1,6 +1,5 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 
 # GLOBAL VARIABLES - DETERMINED VIA RULES
 BUY_IN = 100
@@ -9,15 +8,11 @@ PCT_TRIMESTER = 0.05
 PCT_SPECIAL = 0.10 
 
 
-def prizes_page(app_config: dict):
+def prizes_page(app_config: dict, player_pool: pd.DataFrame):
     _inject_css()
     st.title("Prizes")
 
-    # load player pool
-    sheet_id = app_config["data"]["picks"]["sheet_id"]
-    gid = app_config["data"]["picks"]["gid"][f"player_pool"]
-    url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
-    player_pool = pd.read_csv(url)
+    # player pool
     players = player_pool["Players"]
 
     # calculate numbers
@@ -159,6 +154,8 @@ def _kpi(label, value):
         st.markdown('</div>', unsafe_allow_html=True)
 
 def _donut_chart(labels, values, title="Prize Distribution"):
+    import matplotlib.pyplot as plt  # deferred: only this chart needs matplotlib
+
     fig, ax = plt.subplots(figsize=(4.5, 4.5))
     wedges, _ = ax.pie(values, wedgeprops=dict(width=0.42), startangle=90)
     # draw center circle for donut effect
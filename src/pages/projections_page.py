@@ -0,0 +1,44 @@
+import streamlit as st
+
+# local imports
+from src.logic import SeasonModel, get_projections
+from src.logic.season_simulator import MARGIN_SD, TOP_N, TRIMESTERS
+
+def projections_page(app_config: dict, season_model: SeasonModel):
+    """
+    Displays each player's simulated chance of finishing in the money.
+
+    Probabilities come from playing out the rest of the season many times
+    (see `simulate_season`) and are recomputed in the background after each
+    data refresh, showing the previous run until the new one is ready.
+    """
+    projections, up_to_date = get_projections(app_config, season_model)
+    n_sims = app_config.get("simulation", {}).get("sims", 100_000)
+
+    left, mid, right = st.columns([0.2, 1.0, 0.2])
+    with mid:
+        st.title("Projections")
+        st.caption(
+            f"Based on {n_sims:,} simulated seasons. Unplayed games are drawn around the spread "
+            f"(±{MARGIN_SD} points), and weeks a player has not picked yet use the league's pick habits."
+        )
+        if not up_to_date:
+            st.caption("Updating with the latest scores... showing the previous simulation until it finishes.")
+
+        # filter
+        search = st.text_input("Search player", placeholder="Type to search...")
+        if search:
+            projections = projections[projections["Player"].str.contains(search, case=False, regex=False)]
+
+        percent = lambda label: st.column_config.ProgressColumn(label, format="percent", min_value=0.0, max_value=1.0)
+        st.dataframe(
+            projections,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "Current Points": st.column_config.NumberColumn(format="%.1f", help="Points from finished games"),
+                f"Top {TOP_N}": percent(f"Top {TOP_N}"),
+                **{name: percent(f"Wins {name}") for name in TRIMESTERS},
+                "Special": percent("Special Prize"),
+            },
+        )
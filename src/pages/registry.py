@@ -0,0 +1,60 @@
+import importlib
+from dataclasses import dataclass
+from typing import Callable
+
+# local imports
+from src.utils import load_games, load_player_pool
+from src.logic import get_season_model
+
+# data stages pages can depend on, built only when a page asks for them
+STAGES: dict[str, Callable[[dict], object]] = {
+    "app_config": lambda app_config: app_config,
+    "games": load_games,
+    "player_pool": load_player_pool,
+    "season_model": get_season_model,
+}
+
+@dataclass(frozen=True)
+class Page:
+    """
+    A page and the data stages it needs.
+
+    The page module is only imported the first time the page is rendered,
+    so heavy page dependencies stay out of the app's cold start.
+
+    Attributes:
+        module (str): Module holding the page function, relative to src.pages.
+        requires (tuple[str, ...]): Names of the STAGES the page consumes.
+    """
+    module: str
+    requires: tuple[str, ...] = ()
+
+    def load(self) -> Callable:
+        """
+        Imports the page module and returns its page function.
+        """
+        module = importlib.import_module(f"src.pages.{self.module}")
+        return getattr(module, self.module)
+
+
+PAGES = {
+    "Summary": Page("summary_page", ("app_config", "season_model")),
+    "Matchups and Spreads": Page("matchups_and_spreads_page", ("app_config", "games")),
+    "Standings": Page("standings_page", ("app_config", "season_model")),
+    "Projections": Page("projections_page", ("app_config", "season_model")),
+    "Picks and Scores": Page("picks_page", ("app_config", "season_model")),
+    "Breakdown": Page("breakdown_page", ("app_config", "season_model")),
+    "Head to Head": Page("head_to_head_page", ("app_config", "season_model")),
+    "Remaining Picks": Page("remaining_picks_page", ("app_config", "season_model")),
+    "Prizes": Page("prizes_page", ("app_config", "player_pool")),
+    "Rules": Page("rules_page"),
+}
+
+
+def render_page(name: str, app_config: dict):
+    """
+    Builds only the stages the page requires, then renders it.
+    """
+    page = PAGES[name]
+    inputs = {stage: STAGES[stage](app_config) for stage in page.requires}
+    return page.load()(**inputs)
@@ -1,17 +1,12 @@
 import os
 import glob
+import numpy as np
 import pandas as pd
 import streamlit as st
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
 # local imports
-from src.utils import calculate_week
-
-NFL_TEAMS = [
-    "ARI","ATL","BAL","BUF","CAR","CHI","CIN","CLE","DAL","DEN","DET","GB","HOU","IND",
-    "JAX","KC","LAC","LAR","LV","MIA","MIN","NE","NO","NYG","NYJ","PHI","PIT","SEA","SF","TB","TEN","WAS"
-]
+from src.utils import released_through_week
+from src.logic import SeasonModel, get_survivor_plan
 
 # --------- small CSS for pretty "chips" ----------
 CHIP_CSS = """
@@ -24,11 +19,18 @@ CHIP_CSS = """
 """
 # -------------------------------------------------
 
+SEASON_WEEKS = 18
+OBJECTIVES = {
+    "Win probability": "win_probability",
+    "Favorite margin": "margin",
+}
+
 
-def remaining_picks_page(app_config: dict, overall_scores: pd.DataFrame):
+def remaining_picks_page(app_config: dict, season_model: SeasonModel):
     """
     Displays Survivor: teams a player has USED and which are still AVAILABLE.
     """
+    nfl_teams = season_model.season.teams.teams
     st.markdown(CHIP_CSS, unsafe_allow_html=True)
 
     # centered header row
@@ -36,9 +38,47 @@ def remaining_picks_page(app_config: dict, overall_scores: pd.DataFrame):
     with mid:
         st.title("Remaining Picks")
 
+    # current week's picks don't count until kickoff
+    through_week = released_through_week()
+
+    _player_survivor(season_model, through_week)
+
+    # ----------- league-wide -----------
+    usage = season_model.survivor_usage
+    with st.expander("League-wide availability"):
+        avail_l, avail_r = st.columns([0.5, 0.5], gap="large")
+        with avail_l:
+            st.dataframe(
+                usage.availability(through_week),
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    "Players": st.column_config.NumberColumn(help="Players who can still pick the team"),
+                    "Share": st.column_config.ProgressColumn(format="percent", min_value=0.0, max_value=1.0),
+                },
+            )
+        with avail_r:
+            team = st.selectbox("Team", options=nfl_teams)
+            week = st.number_input(
+                "Week", min_value=1, max_value=SEASON_WEEKS, value=min(through_week + 1, SEASON_WEEKS)
+            )
+            eligible = usage.players[usage.can_pick(nfl_teams.index(team), week, through=through_week)]
+            st.caption(f"{len(eligible)} of {len(usage.players)} players can still pick {team} in week {week}.")
+            st.dataframe(pd.DataFrame({"Player": sorted(eligible, key=lambda s: s.strip().lower())}), hide_index=True)
+
+
+@st.fragment
+def _player_survivor(season_model: SeasonModel, through_week: int):
+    """
+    Player selector, their used and remaining teams and the suggested path;
+    changing the player reruns only this.
+    """
+    nfl_teams = season_model.season.teams.teams
+
     # players list (case-insensitive sort)
-    players = sorted(overall_scores["Player"].dropna().unique().tolist(), key=lambda s: s.strip().lower())
+    players = season_model.player_directory.names
 
+    left, mid, right = st.columns([0.1, 1.0, 0.1])
     with mid:
         selected_player = st.selectbox(
             "Select player (type to search)",
@@ -51,38 +91,26 @@ def remaining_picks_page(app_config: dict, overall_scores: pd.DataFrame):
 
     # Filter + tidy
     df_player = (
-        overall_scores.loc[overall_scores["Player"] == selected_player, ["Week", "Survivor Pick"]]
+        season_model.player_scores(selected_player)[["Week", "Survivor Pick"]]
         .copy()
     )
-    # Normalize abbreviations
-    df_player["Survivor Pick"] = (
-        df_player["Survivor Pick"]
-        .astype(str).str.strip().str.upper().replace({"": None})
-    )
+    # abbreviations are normalized by the team registry at ingest
+    df_player["Survivor Pick"] = df_player["Survivor Pick"].astype(object)
     # Sort by week (numeric if possible)
     with pd.option_context("mode.chained_assignment", None):
         df_player["Week"] = pd.to_numeric(df_player["Week"], errors="coerce")
     df_player = df_player.sort_values("Week")
 
-    used = [t for t in df_player["Survivor Pick"].dropna().tolist() if t]
-
-    # remove value if time is before kickoff time
-    current_week = calculate_week()
-    ET = ZoneInfo("America/New_York")
-    first_sunday = datetime(2025, 9, 7, 13, 0, 0, tzinfo=ET)  # CHANGE THIS if needed
-    picks_release_date = first_sunday + timedelta(weeks=current_week - 1)
-    current_time = datetime.now(ET)
-    if current_time < picks_release_date:
-        used = used[:-1]
-    used_unique = []
-    seen = set()
-    for t in used:  # preserve first-use order
-        if t not in seen:
-            used_unique.append(t)
-            seen.add(t)
-
-    # Remaining = all NFL teams not yet used
-    remaining = [t for t in NFL_TEAMS if t not in seen]
+    # used / remaining are bit operations on the league-wide usage masks
+    usage = season_model.survivor_usage
+    row = usage.index.get_loc(selected_player)
+    used_unique = usage.first_use_order(selected_player, through_week)
+    remaining = usage.decode(usage.remaining_after(through_week)[row])
+    reused_weeks = np.flatnonzero(usage.duplicates()[row, :through_week + 1])
+
+    # weeks left to plan: unfinished weeks without a counted survivor pick
+    open_weeks = np.flatnonzero(season_model.open_weeks[1:SEASON_WEEKS + 1]) + 1
+    plan_weeks = [int(w) for w in open_weeks if w > through_week or usage.picks[row, w] < 0]
 
     # ----------- render -----------
     body_l, body_r = st.columns([0.52, 0.48], gap="large")
@@ -93,6 +121,8 @@ def remaining_picks_page(app_config: dict, overall_scores: pd.DataFrame):
             st.markdown('<div class="badges">' + "".join([f'<span class="badge used">{t}</span>' for t in used_unique]) + "</div>", unsafe_allow_html=True)
         else:
             st.info("No Survivor picks recorded yet for this player.")
+        if len(reused_weeks):
+            st.warning("Team picked again in week " + ", ".join(map(str, reused_weeks)) + ".")
 
         # Week-by-week table
         if not df_player.empty:
@@ -115,7 +145,26 @@ def remaining_picks_page(app_config: dict, overall_scores: pd.DataFrame):
         st.subheader("Remaining teams")
         if remaining:
             st.markdown('<div class="badges">' + "".join([f'<span class="badge remaining">{t}</span>' for t in remaining]) + "</div>", unsafe_allow_html=True)
-            st.caption(f"{len(remaining)} of {len(NFL_TEAMS)} teams available.")
+            st.caption(f"{len(remaining)} of {len(nfl_teams)} teams available.")
         else:
             st.success("No teams remaining — you’ve used them all!")
 
+    # ----------- planner -----------
+    if plan_weeks and remaining:
+        st.subheader("Suggested path")
+        objective = st.radio("Optimize for", options=list(OBJECTIVES), horizontal=True)
+        plan = get_survivor_plan(season_model, selected_player, used_unique, plan_weeks, OBJECTIVES[objective])
+        st.dataframe(
+            plan,
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "Week": st.column_config.NumberColumn(format="%d", width=60),
+                "Spread": st.column_config.NumberColumn(format="%+.1f", help="Negative when favored"),
+                "Win Probability": st.column_config.ProgressColumn(format="percent", min_value=0.0, max_value=1.0),
+            },
+        )
+        st.caption(
+            "Each remaining team used at most once, chosen to maximize the total over the remaining weeks. "
+            "Weeks without a posted spread are treated as a toss-up."
+        )
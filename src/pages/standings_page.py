@@ -4,9 +4,18 @@ import numpy as np
 from pathlib import Path
 
 # local imports
-from src.utils import calculate_week
-
-def standings_page(app_config: dict, overall_scores: pd.DataFrame):
+from src.utils import TableSpec, calculate_week, paginate, render_table
+from src.logic import SeasonModel, StandingsCube
+
+TERMS = {
+    "all": (1, 18, "Overall", 10),
+    "first": (1, 6, "Weeks 1-6", 1),
+    "second": (7, 12, "Weeks 7-12", 1),
+    "third": (13, 18, "Weeks 13-18", 1),
+}
+PAGE_SIZE = 50
+
+def standings_page(app_config: dict, season_model: SeasonModel):
     """
     Displays standings.
     
@@ -15,17 +24,22 @@ def standings_page(app_config: dict, overall_scores: pd.DataFrame):
         * Weeks 1-6
         * Weeks 7-12
         * Weeks 13-18
+        * Custom week range
         
     And there is a special tab for the Special Prize.
     """
+    overall_scores = season_model.scores
+    standings = season_model.standings
+
     # styling
     _inject_css()
 
-    # calculate points
-    overall_points = _calculate_points(overall_scores, "all")
-    first_period_points = _calculate_points(overall_scores, "first")
-    second_period_points = _calculate_points(overall_scores, "second")
-    third_period_points = _calculate_points(overall_scores, "third")
+    # calculate points (with clinched / eliminated flags)
+    open_weeks = season_model.open_weeks
+    overall_points = _calculate_points(standings, "all", open_weeks)
+    first_period_points = _calculate_points(standings, "first", open_weeks)
+    second_period_points = _calculate_points(standings, "second", open_weeks)
+    third_period_points = _calculate_points(standings, "third", open_weeks)
 
     # calculate special prize winners
     special_prize_winners = _calculate_special(overall_scores)
@@ -36,25 +50,32 @@ def standings_page(app_config: dict, overall_scores: pd.DataFrame):
         st.title("Standings")
         
         # define tabs
-        overall, period_one, period_two, period_three, special_prize = st.tabs(
-            ["Overall", "Weeks 1-6", "Weeks 7-12", "Weeks 13-18", "Special Prize"]
+        overall, period_one, period_two, period_three, custom, special_prize = st.tabs(
+            ["Overall", "Weeks 1-6", "Weeks 7-12", "Weeks 13-18", "Custom", "Special Prize"]
         )
 
         # display
         with overall:
-            html = _style_table(overall_points, numeric_cols=["Overall"], table_class="standings")
+            html = _style_table(paginate(overall_points, key="standings_overall", page_size=PAGE_SIZE), numeric_cols=["Overall"], table_class="standings")
             st.markdown(html, unsafe_allow_html=True)
 
         with period_one:
-            html = _style_table(first_period_points, numeric_cols=["Weeks 1-6"], table_class="standings")
+            html = _style_table(paginate(first_period_points, key="standings_first", page_size=PAGE_SIZE), numeric_cols=["Weeks 1-6"], table_class="standings")
             st.markdown(html, unsafe_allow_html=True)
 
         with period_two:
-            html = _style_table(second_period_points, numeric_cols=["Weeks 7-12"], table_class="standings")
+            html = _style_table(paginate(second_period_points, key="standings_second", page_size=PAGE_SIZE), numeric_cols=["Weeks 7-12"], table_class="standings")
             st.markdown(html, unsafe_allow_html=True)
 
         with period_three:
-            html = _style_table(third_period_points, numeric_cols=["Weeks 13-18"], table_class="standings")
+            html = _style_table(paginate(third_period_points, key="standings_third", page_size=PAGE_SIZE), numeric_cols=["Weeks 13-18"], table_class="standings")
+            st.markdown(html, unsafe_allow_html=True)
+
+        with custom:
+            start_week, end_week = st.slider("Weeks", min_value=1, max_value=18, value=(1, calculate_week()))
+            label = f"Weeks {start_week}-{end_week}"
+            custom_points = standings.standings(start_week, end_week, label)
+            html = _style_table(paginate(custom_points, key="standings_custom", page_size=PAGE_SIZE), numeric_cols=[label], table_class="standings")
             st.markdown(html, unsafe_allow_html=True)
 
         with special_prize:
@@ -83,72 +104,18 @@ def _calculate_special(overall_scores: pd.DataFrame):
 
 
 def _calculate_points(
-    overall_scores: pd.DataFrame,
-    term: str
+    standings: StandingsCube,
+    term: str,
+    open_weeks: np.ndarray
 ):
     """
-    Filters data by term, then calculates scores.
+    Slices the standings cube by term, then ranks players and flags who has
+    clinched or been eliminated from the term's payout positions.
     """
-    # make data copy
-    temp_scores = overall_scores.copy()
-
     # define time period
-    if term == "all":
-        start_week = 1
-        end_week = 18
-        label = "Overall"
-    elif term == "first":
-        start_week = 1
-        end_week = 6
-        label = "Weeks 1-6"
-    elif term == "second":
-        start_week = 7
-        end_week = 12
-        label = "Weeks 7-12"
-    elif term == "third":
-        start_week = 13
-        end_week = 18
-        label = "Weeks 13-18"
-
-    # filter dates
-    temp_scores = temp_scores.loc[
-        (temp_scores["Week"] >= start_week) & (temp_scores["Week"] <= end_week),
-        :
-        ]
-    
-    # coerce for pushes
-    temp_scores["Total Points"] = pd.to_numeric(temp_scores["Total Points"], errors="coerce").fillna(0.0)
-    
-    # calculate scores
-    scores = (
-        temp_scores.groupby("Player", as_index=False)["Total Points"]
-        .sum()
-        .rename(columns={"Total Points": label})
-        .sort_values(label, ascending=False)
-    )
+    start_week, end_week, label, positions = TERMS[term]
 
-    # # add rank
-    # scores["Rank"] = scores[label].rank(method="dense", ascending=False).astype(int)
-    # scores = scores[["Rank", "Player", label]].sort_values(["Rank", "Player"])
-
-    # sort first by score (descending), then player (alphabetical)
-    scores = scores.sort_values(
-        [label, "Player"],
-        ascending=[False, True],
-        key=lambda col: col.str.lower() if col.name == "Player" else col
-    )
-
-    # assign rank with ties handled
-    scores["Rank"] = (
-        scores[label]
-        .rank(method="min", ascending=False)  # "min" ensures ties share the same rank
-        .astype(int)
-    )
-
-    # reorder columns
-    scores = scores[["Rank", "Player", label]]
-
-    return scores
+    return standings.standings(start_week, end_week, label, open_weeks=open_weeks, positions=positions)
 
 def _inject_css():
     st.markdown("""
@@ -294,28 +261,17 @@ def _rank_badge(val: int) -> str:
     return f"<span class='{cls}'>#{int(val)}</span>"
 
 def _fmt_pts(val: float) -> str:
-    return f"{val:.1f}"
+    return f"{float(val):.1f}"
 
 def _style_table(df: pd.DataFrame, *, numeric_cols: list[str], table_class: str) -> str:
     """
     Return safe HTML for a styled table (works with your CSS).
     Renders Rank as a badge and formats numeric columns to 1 decimal.
     """
-    render = df.copy()
-
-    if "Rank" in render.columns:
-        render["Rank"] = render["Rank"].map(_rank_badge)
-
-    for c in numeric_cols:
-        if c in render.columns:
-            render[c] = render[c].astype(float).map(_fmt_pts)
-
-    sty = (render.style
-           .hide(axis="index")
-           .set_table_styles([
-               {"selector": "th", "props": [("text-align", "left"), ("font-weight", "700"), ("padding", "8px 10px")]},
-               {"selector": "td", "props": [("padding", "8px 10px"), ("vertical-align", "middle")]}
-           ]))
-
-    html = sty.to_html(escape=False)
-    return f"<div class='{table_class}'>{html}</div>"
\ No newline at end of file
+    spec = TableSpec(
+        table_class=table_class,
+        formatters=(("Rank", _rank_badge), *((c, _fmt_pts) for c in numeric_cols)),
+        th_style="text-align: left; font-weight: 700; padding: 8px 10px",
+        td_style="padding: 8px 10px; vertical-align: middle",
+    )
+    return render_table(df, spec)
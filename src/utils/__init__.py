@@ -1,5 +1,21 @@
+from .assignment import linear_sum_assignment
 from .calculate_week import calculate_week
 from .calculate_weekly_scores import calculate_weekly_scores
+from .data_repository import load_games, load_logos, load_picks, load_player_pool
 from .determine_game_winners import determine_game_winners
 from .fetch_csv import fetch_csv
-from .load_yaml import load_yaml
\ No newline at end of file
+from .hash_frame import hash_frame
+from .html_table import TableSpec, render_table
+from .live_scoring import LiveUpdate, rescore_changed_games
+from .load_season import Season, load_season
+from .load_yaml import load_yaml
+from .logo_assets import LogoAssets, build_logo_assets, get_logo_assets
+from .outcome_index import OutcomeIndex, build_outcome_index
+from .paginate import PageWindow, page_window, paginate
+from .pick_index import PickIndex, build_pick_index
+from .picks_release import picks_released, released_through_week
+from .score_cache import ScoreCache, get_score_cache
+from .score_season import score_season, score_weeks
+from .season_schema import compact_scores
+from .sheet_cache import SheetCache, get_sheet_cache
+from .teams import TeamRegistry, build_team_registry, load_team_registry
@@ -0,0 +1,63 @@
+import numpy as np
+
+def linear_sum_assignment(cost: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Minimum-cost assignment of rows to columns (Hungarian algorithm).
+
+    Every row of the smaller side is matched to a distinct column (or the
+    other way round if there are more rows than columns). Uses the
+    shortest augmenting path form with row/column potentials, O(n^2 m),
+    with the inner column scan vectorized in NumPy.
+
+    Returns:
+        tuple: Row indices (sorted) and their assigned column indices,
+            matching `scipy.optimize.linear_sum_assignment`.
+    """
+    cost = np.asarray(cost, dtype=float)
+    transposed = cost.shape[0] > cost.shape[1]
+    if transposed:
+        cost = cost.T
+    num_rows, num_cols = cost.shape
+
+    # 1-based potentials and matching; column 0 is a virtual start column
+    u = np.zeros(num_rows + 1)
+    v = np.zeros(num_cols + 1)
+    match = np.zeros(num_cols + 1, dtype=int)  # row matched to each column (0 = none)
+    way = np.zeros(num_cols + 1, dtype=int)
+
+    for row in range(1, num_rows + 1):
+        match[0] = row
+        col = 0
+        min_slack = np.full(num_cols + 1, np.inf)
+        visited = np.zeros(num_cols + 1, dtype=bool)
+
+        # grow a shortest augmenting path until it reaches a free column
+        while match[col] != 0:
+            visited[col] = True
+            current = match[col]
+            slack = cost[current - 1] - u[current] - v[1:]
+            improved = ~visited[1:] & (slack < min_slack[1:])
+            min_slack[1:][improved] = slack[improved]
+            way[1:][improved] = col
+
+            candidates = np.where(visited[1:], np.inf, min_slack[1:])
+            next_col = int(np.argmin(candidates)) + 1
+            delta = candidates[next_col - 1]
+
+            u[match[visited]] += delta
+            v[visited] -= delta
+            min_slack[~visited] -= delta
+            col = next_col
+
+        # flip the path
+        while col:
+            previous = way[col]
+            match[col] = match[previous]
+            col = previous
+
+    cols = np.flatnonzero(match[1:])
+    rows = match[1:][cols] - 1
+    if transposed:
+        rows, cols = cols, rows
+    order = np.argsort(rows)
+    return rows[order], cols[order]
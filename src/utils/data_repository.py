@@ -0,0 +1,68 @@
+import pandas as pd
+
+# local imports
+from .fetch_csv import fetch_csv, sheet_key
+from .load_yaml import load_yaml
+from .sheet_cache import SheetCache, get_sheet_cache
+
+def sheet_cache(app_config: dict) -> SheetCache:
+    """
+    Shared sheet cache configured by the `cache` section of the app config.
+    """
+    cache_config = app_config.get("cache", {})
+    return get_sheet_cache(
+        ttl=cache_config.get("ttl", 3600),
+        max_stale=cache_config.get("max_stale", 0),
+    )
+
+
+def load_picks(app_config: dict, week: int) -> pd.DataFrame:
+    """
+    Loads the picks sheet for a week.
+    """
+    sheet_id = app_config["data"]["picks"]["sheet_id"]
+    gid = app_config["data"]["picks"]["gid"][f"week{week}"]
+    return fetch_csv(sheet_id, gid, sheet_cache(app_config))
+
+
+def load_games(app_config: dict, week: int | None = None) -> pd.DataFrame:
+    """
+    Loads the games sheet, optionally filtered to a single week.
+    """
+    sheet_id = app_config["data"]["games"]["sheet_id"]
+    gid = app_config["data"]["games"]["gid"]
+    games = fetch_csv(sheet_id, gid, sheet_cache(app_config))
+    if week is None:
+        return games
+    return games.loc[games["Week"] == int(week), :]
+
+
+def season_sheet_keys(app_config: dict, week: int) -> tuple:
+    """
+    Sheet cache keys of the sheets a season through week is built from
+    (the games sheet and weeks 1..week of picks).
+    """
+    picks = app_config["data"]["picks"]
+    games = app_config["data"]["games"]
+    return (
+        sheet_key(games["sheet_id"], games["gid"]),
+        *(sheet_key(picks["sheet_id"], picks["gid"][f"week{i}"]) for i in range(1, week + 1)),
+    )
+
+
+def load_player_pool(app_config: dict) -> pd.DataFrame:
+    """
+    Loads the player pool sheet.
+    """
+    sheet_id = app_config["data"]["picks"]["sheet_id"]
+    gid = app_config["data"]["picks"]["gid"]["player_pool"]
+    return fetch_csv(sheet_id, gid, sheet_cache(app_config))
+
+
+def load_logos(app_config: dict) -> dict:
+    """
+    Loads the team -> logo URL mapping.
+    """
+    logos_path = app_config["config"]["logos"]
+    logos = sheet_cache(app_config).get(("yaml", logos_path), lambda: load_yaml(logos_path))
+    return dict(logos)
@@ -13,7 +13,10 @@ def determine_game_winners(
         * Spread Winner
     
     NOTE: Ties and pushes are included.
+    NOTE: The input is not modified; a copy with the new columns is returned.
     """
+    weekly_outcomes = weekly_outcomes.copy()
+
     # calculate game winner
     # NOTE: Ties are included.
     weekly_outcomes["Game Winner"] = np.where(
@@ -1,8 +1,27 @@
-import streamlit as st
 import pandas as pd
 
+# local imports
+from .sheet_cache import SheetCache, get_sheet_cache
+
+def sheet_url(sheet_id: str, gid: str | int) -> str:
+    return f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
+
+def sheet_key(sheet_id: str, gid: str | int) -> tuple:
+    """
+    Sheet cache key of a Google Sheet tab.
+    """
+    return ("csv", sheet_id, str(gid))
+
 # --- Cached fetcher with TTL ---
-@st.cache_data(ttl=3600)  # refreshes automatically every 1 hour
-def fetch_csv(sheet_id: str, gid: str | int) -> pd.DataFrame:
-    url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv&gid={gid}"
-    return pd.read_csv(url)
\ No newline at end of file
+def fetch_csv(sheet_id: str, gid: str | int, cache: SheetCache | None = None) -> pd.DataFrame:
+    """
+    Fetches a Google Sheet tab as a dataframe through the shared sheet cache.
+
+    A copy is returned so callers are free to mutate it.
+    """
+    cache = cache or get_sheet_cache()
+    df = cache.get(
+        sheet_key(sheet_id, gid),
+        lambda: pd.read_csv(sheet_url(sheet_id, gid))
+    )
+    return df.copy()
\ No newline at end of file
@@ -0,0 +1,12 @@
+import hashlib
+
+import pandas as pd
+
+def hash_frame(df: pd.DataFrame) -> str:
+    """
+    Content hash of a dataframe (values, index and column names).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
\ No newline at end of file
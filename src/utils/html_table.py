@@ -0,0 +1,82 @@
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+
+import pandas as pd
+import streamlit as st
+
+# local imports
+from .hash_frame import hash_frame
+
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    How a table is rendered to HTML.
+
+    Attributes:
+        table_class (str): Class of the wrapping div (the page CSS targets it).
+        formatters (tuple[tuple[str, Callable], ...]): (column, formatter)
+            pairs; a formatter turns one cell into its HTML.
+        th_style (str): Inline style of every header cell.
+        td_style (str): Inline style of every body cell.
+    """
+    table_class: str
+    formatters: tuple[tuple[str, Callable[[object], str]], ...] = ()
+    th_style: str = ""
+    td_style: str = ""
+
+    @property
+    def key(self) -> tuple:
+        """
+        Hashable identity of the spec (formatters by qualified name).
+        """
+        formatters = tuple((column, f"{fn.__module__}.{fn.__qualname__}") for column, fn in self.formatters)
+        return (self.table_class, formatters, self.th_style, self.td_style)
+
+
+def render_table(df: pd.DataFrame, spec: TableSpec) -> str:
+    """
+    Renders a dataframe as a plain HTML table (no index) inside
+    `<div class='{spec.table_class}'>`.
+
+    The HTML is memoized by the frame's content hash and the spec, so an
+    unchanged table is served from cache on rerun. Cells are not escaped;
+    formatters may return markup.
+    """
+    return _cached_html(hash_frame(df), spec.key, df, spec)
+
+
+@st.cache_resource(max_entries=64)
+def _cached_html(frame_key: str, spec_key: tuple, _df: pd.DataFrame, _spec: TableSpec) -> str:
+    formatters = dict(_spec.formatters)
+    head, row, foot = _templates(tuple(map(str, _df.columns)), _spec.table_class, _spec.th_style, _spec.td_style)
+
+    columns = [
+        list(map(formatters.get(column, _default_format), _df[column].tolist()))
+        for column in _df.columns
+    ]
+    body = "".join(row.format(*cells) for cells in zip(*columns))
+    return head + body + foot
+
+
+@lru_cache(maxsize=64)
+def _templates(columns: tuple[str, ...], table_class: str, th_style: str, td_style: str) -> tuple[str, str, str]:
+    """
+    Precompiled header, row format string and footer for a column layout.
+    """
+    th = f" style='{th_style}'" if th_style else ""
+    td = f" style='{td_style}'" if td_style else ""
+    header = "".join(f"<th{th}>{column}</th>" for column in columns)
+    head = f"<div class='{table_class}'><table><thead><tr>{header}</tr></thead><tbody>"
+    row = "<tr>" + f"<td{td}>{{}}</td>" * len(columns) + "</tr>"
+    return head, row, "</tbody></table></div>"
+
+
+def _default_format(value: object) -> str:
+    """
+    Cell text the way pandas Styler shows it by default (6 decimal floats).
+    """
+    if isinstance(value, float):
+        return "nan" if math.isnan(value) else f"{value:.6f}"
+    return str(value)
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# local imports
+from .outcome_index import OutcomeIndex
+from .pick_index import PickIndex
+from .score_season import score_pick_codes
+from .season_schema import SPREAD_POINT_COLS
+
+@dataclass(frozen=True)
+class LiveUpdate:
+    """
+    Rows of overall_scores changed by a live rescore.
+
+    Attributes:
+        base (pd.DataFrame): Frame the update was applied to.
+        rows (np.ndarray): Row positions in overall_scores.
+        players (np.ndarray): Player of each row.
+        weeks (np.ndarray): Week of each row.
+        total_delta (np.ndarray): Change in Total Points.
+        survivor_delta (np.ndarray): Change in Survivor Point.
+        special_delta (np.ndarray): Change in Special.
+    """
+    base: pd.DataFrame
+    rows: np.ndarray
+    players: np.ndarray
+    weeks: np.ndarray
+    total_delta: np.ndarray
+    survivor_delta: np.ndarray
+    special_delta: np.ndarray
+
+
+def changed_cells(old: OutcomeIndex, new: OutcomeIndex) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (week, team_id) cells whose game or spread outcome differs between indexes.
+    """
+    weeks = min(old.num_weeks, new.num_weeks) + 1
+    changed = (
+        (old.game_winner[:weeks] != new.game_winner[:weeks])
+        | (old.base_points[:weeks] != new.base_points[:weeks])
+    )
+    changed[:, -1] = False  # unknown-team column
+    return np.nonzero(changed)
+
+
+def rescore_changed_games(
+    overall_scores: pd.DataFrame,
+    pick_index: PickIndex,
+    old: OutcomeIndex,
+    new: OutcomeIndex
+) -> tuple[pd.DataFrame, LiveUpdate]:
+    """
+    Rescores only the picks whose game outcome flipped.
+
+    The affected rows are found through the (week, team) inverted index, so
+    the scoring work is proportional to the number of affected picks rather
+    than the league size. The input frame is left untouched (it may be a
+    shared snapshot); unchanged columns are shared with the returned frame
+    and only the point columns are copied and patched.
+    """
+    weeks, teams = changed_cells(old, new)
+    rows, _ = pick_index.lookup(weeks, teams)
+    rows = np.unique(rows)
+
+    # rescore affected rows
+    survivor, spread_points, total, special = score_pick_codes(
+        pick_index.weeks[rows], pick_index.codes[rows].astype(np.intp), new
+    )
+
+    # patch copies of the point columns
+    rescored = overall_scores.copy(deep=False)
+    deltas = {}
+    for col, values in (
+        ("Survivor Point", survivor),
+        ("Total Points", total),
+        ("Special", special),
+        *zip(SPREAD_POINT_COLS, spread_points.T),
+    ):
+        column = overall_scores[col].to_numpy(copy=True)
+        deltas[col] = values.astype(column.dtype) - column[rows]
+        column[rows] = values
+        rescored[col] = column
+
+    update = LiveUpdate(
+        base=overall_scores,
+        rows=rows,
+        players=overall_scores["Player"].to_numpy()[rows],
+        weeks=pick_index.weeks[rows],
+        total_delta=deltas["Total Points"],
+        survivor_delta=deltas["Survivor Point"],
+        special_delta=deltas["Special"],
+    )
+    return rescored, update
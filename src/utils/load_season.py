@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pandas as pd
+
+# local imports
+from .data_repository import load_games, load_picks
+from .outcome_index import OutcomeIndex, build_outcome_index
+from .teams import TeamRegistry, load_team_registry
+
+@dataclass(frozen=True)
+class Season:
+    """
+    Raw season data, split by week.
+
+    Attributes:
+        week (int): Latest week included in the season.
+        picks (dict[int, pd.DataFrame]): Picks sheet for each week.
+        games (dict[int, pd.DataFrame]): Games sheet rows for each week.
+        teams (TeamRegistry): Team IDs and aliases used to read the picks.
+        outcomes (OutcomeIndex): Game outcomes for every week, by [week, team_id].
+    """
+    week: int
+    picks: dict[int, pd.DataFrame]
+    games: dict[int, pd.DataFrame]
+    teams: TeamRegistry
+    outcomes: OutcomeIndex
+
+
+def load_season(app_config: dict, week: int, max_workers: int = 8) -> Season:
+    """
+    Loads weeks 1..week of picks and games.
+
+    The picks sheets are fetched concurrently with a bounded thread pool and
+    the games sheet is fetched exactly once, then split by week in memory
+    and indexed into a season-wide OutcomeIndex.
+    """
+    weeks = list(range(1, week + 1))
+
+    # fetch everything concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        games_future = pool.submit(load_games, app_config)
+        picks_futures = {i: pool.submit(load_picks, app_config, i) for i in weeks}
+        games_data = games_future.result()
+        picks = {i: future.result() for i, future in picks_futures.items()}
+
+    # split games by week
+    games_by_week = dict(tuple(games_data.groupby("Week", sort=True)))
+    games = {
+        i: games_by_week.get(i, games_data.iloc[0:0]).copy()
+        for i in weeks
+    }
+
+    # outcome index for every game
+    teams = load_team_registry(app_config["config"]["logos"])
+    outcomes = build_outcome_index(games_data, teams)
+
+    return Season(week=week, picks=picks, games=games, teams=teams, outcomes=outcomes)
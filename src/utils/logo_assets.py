@@ -0,0 +1,127 @@
+import base64
+import hashlib
+import io
+import os
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+# local imports
+from .data_repository import load_logos
+
+LOGO_HEIGHT = 80  # px; twice the 40px display height for sharp logos on high-DPI screens
+FETCH_TIMEOUT = 10  # seconds
+RETRY_AFTER = 60  # seconds before a logo that failed to load is tried again
+
+class LogoAssets:
+    """
+    Process-wide store of downsized logos, as PNG data URIs.
+
+    Resized files are kept in cache_dir (named by source and height), so each
+    source image is downloaded at most once per deployment. Sources may be
+    URLs or local file paths.
+
+    Only logos that loaded are kept. One that can't be fetched or decoded is
+    served as its original source and tried again once `retry_after`
+    seconds have passed, so a transient network failure doesn't disable the
+    cache until the next restart.
+    """
+    def __init__(self, cache_dir: str, height: int = LOGO_HEIGHT, retry_after: float = RETRY_AFTER):
+        self.cache_dir = cache_dir
+        self.height = height
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._uris: dict[str, str] = {}
+        self._failed_at: dict[str, float] = {}
+
+    def get(self, logos: dict) -> dict:
+        """
+        Returns team -> logo data URI (the original source for logos that
+        failed to load).
+        """
+        now = time.monotonic()
+        with self._lock:
+            missing = sorted(
+                source for source in set(logos.values())
+                if source not in self._uris and now - self._failed_at.get(source, -self.retry_after) >= self.retry_after
+            )
+
+        if missing:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with ThreadPoolExecutor(max_workers=8, thread_name_prefix="logo-assets") as pool:
+                loaded = dict(zip(missing, pool.map(self._load, missing)))
+            with self._lock:
+                for source, uri in loaded.items():
+                    if uri is None:
+                        self._failed_at[source] = now
+                    else:
+                        self._uris[source] = uri
+                        self._failed_at.pop(source, None)
+
+        with self._lock:
+            return {team: self._uris.get(source, source) for team, source in logos.items()}
+
+    def _load(self, source: str) -> str | None:
+        """
+        Data URI of the resized logo for one source (None on failure).
+        """
+        name = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+        path = os.path.join(self.cache_dir, f"{name}_{self.height}.png")
+        try:
+            if not os.path.exists(path):
+                _resize(_read_source(source), path, self.height)
+            with open(path, "rb") as f:
+                return "data:image/png;base64," + base64.b64encode(f.read()).decode()
+        except (OSError, ValueError):
+            return None
+
+
+def build_logo_assets(logos: dict, cache_dir: str, height: int = LOGO_HEIGHT) -> dict:
+    """
+    Downsizes every logo once and returns team -> PNG data URI (see `LogoAssets`).
+    """
+    return LogoAssets(cache_dir, height).get(logos)
+
+
+def _read_source(source: str) -> bytes:
+    if os.path.exists(source):
+        with open(source, "rb") as f:
+            return f.read()
+    with urllib.request.urlopen(source, timeout=FETCH_TIMEOUT) as response:
+        return response.read()
+
+
+def _resize(data: bytes, path: str, height: int):
+    """
+    Scales an image to the given height (never up) and writes it as PNG.
+    """
+    # Pillow is only needed the first time a logo is resized
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        image = image.convert("RGBA")
+        if image.height > height:
+            image = image.resize((max(round(image.width * height / image.height), 1), height), Image.LANCZOS)
+
+        # write then rename, so a concurrent reader never sees a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        image.save(tmp_path, format="PNG", optimize=True)
+    os.replace(tmp_path, path)
+
+
+@st.cache_resource
+def _logo_assets(cache_dir: str, height: int) -> LogoAssets:
+    return LogoAssets(cache_dir, height)
+
+
+def get_logo_assets(app_config: dict) -> dict:
+    """
+    Returns team -> small logo data URI, from the process-wide logo store.
+    """
+    config = app_config["config"]
+    cache_dir = config.get("logo_cache", "artifacts/logos")
+    height = config.get("logo_height", LOGO_HEIGHT)
+    return _logo_assets(cache_dir, height).get(load_logos(app_config))
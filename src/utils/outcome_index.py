@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# local imports
+from .teams import TeamRegistry
+
+SEASON_WEEKS = 18
+
+@dataclass(frozen=True)
+class OutcomeIndex:
+    """
+    Game outcomes for the whole season, addressable by [week, team_id].
+
+    Every array has shape (weeks + 1, teams + 1). Row 0 is unused so weeks
+    index directly, and the last column is an empty "unknown team" slot, so
+    a team ID of -1 (missing/unknown pick) reads as no game.
+
+    NOTE: Ties and pushes follow `determine_game_winners`: a game without
+    scores counts as an away win and an away cover until it is played.
+
+    Attributes:
+        teams (TeamRegistry): Registry the team IDs come from.
+        has_game (np.ndarray): Team plays that week.
+        final (np.ndarray): Team's game has both scores.
+        is_home (np.ndarray): Team is the home team.
+        opponent (np.ndarray): Opponent team ID (-1 if no game).
+        spread (np.ndarray): Team's spread (home spread for home, negated for away).
+        game_winner (np.ndarray): Team won its game.
+        spread_winner (np.ndarray): Team covered the spread.
+        tie (np.ndarray): Team's game was a tie.
+        push (np.ndarray): Team's game was a push against the spread.
+        base_points (np.ndarray): Spread points before weighting (1.0 cover, 0.5 push, 0.0 otherwise).
+    """
+    teams: TeamRegistry
+    has_game: np.ndarray
+    final: np.ndarray
+    is_home: np.ndarray
+    opponent: np.ndarray
+    spread: np.ndarray
+    game_winner: np.ndarray
+    spread_winner: np.ndarray
+    tie: np.ndarray
+    push: np.ndarray
+    base_points: np.ndarray
+
+    @property
+    def num_weeks(self) -> int:
+        return self.has_game.shape[0] - 1
+
+
+def build_outcome_index(games: pd.DataFrame, teams: TeamRegistry) -> OutcomeIndex:
+    """
+    Computes every game's winner, spread winner, push/tie flags and per-team
+    base points once for the whole games sheet.
+    """
+    week = pd.to_numeric(games["Week"], errors="coerce").fillna(0).to_numpy(dtype=int)
+    home = teams.encode(games["Home Team"].to_numpy(dtype=object)).astype(int)
+    away = teams.encode(games["Away Team"].to_numpy(dtype=object)).astype(int)
+    home_score = pd.to_numeric(games["Home Score"], errors="coerce").to_numpy(dtype=float)
+    away_score = pd.to_numeric(games["Away Score"], errors="coerce").to_numpy(dtype=float)
+    home_spread = pd.to_numeric(games["Home Spread"], errors="coerce").to_numpy(dtype=float)
+
+    # per-game outcomes (ties and pushes are included)
+    tie = home_score == away_score
+    home_won = home_score > away_score
+    push = (home_score + home_spread) == away_score
+    home_covered = (home_score + home_spread) > away_score
+    final = ~np.isnan(home_score) & ~np.isnan(away_score)
+
+    shape = (max(SEASON_WEEKS, int(week.max(initial=0))) + 1, len(teams) + 1)
+    index = OutcomeIndex(
+        teams=teams,
+        has_game=np.zeros(shape, dtype=bool),
+        final=np.zeros(shape, dtype=bool),
+        is_home=np.zeros(shape, dtype=bool),
+        opponent=np.full(shape, -1, dtype=np.int16),
+        spread=np.full(shape, np.nan, dtype=np.float32),
+        game_winner=np.zeros(shape, dtype=bool),
+        spread_winner=np.zeros(shape, dtype=bool),
+        tie=np.zeros(shape, dtype=bool),
+        push=np.zeros(shape, dtype=bool),
+        base_points=np.zeros(shape, dtype=np.float32),
+    )
+
+    # scatter each game into both teams' cells
+    for team, opponent, is_home, won, covered, spread in (
+        (home, away, True, home_won & ~tie, home_covered & ~push, home_spread),
+        (away, home, False, ~home_won & ~tie, ~home_covered & ~push, -home_spread),
+    ):
+        index.has_game[week, team] = True
+        index.final[week, team] = final
+        index.is_home[week, team] = is_home
+        index.opponent[week, team] = opponent
+        index.spread[week, team] = spread
+        index.game_winner[week, team] = won
+        index.spread_winner[week, team] = covered
+        index.tie[week, team] = tie
+        index.push[week, team] = push
+        index.base_points[week, team] = np.where(push, 0.5, covered.astype(np.float32))
+
+    # unknown teams never have a game
+    for array in (index.has_game, index.final, index.is_home, index.game_winner,
+                  index.spread_winner, index.tie, index.push):
+        array[:, -1] = False
+    index.opponent[:, -1] = -1
+    index.spread[:, -1] = np.nan
+    index.base_points[:, -1] = 0.0
+
+    return index
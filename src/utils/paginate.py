@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+
+import pandas as pd
+import streamlit as st
+
+@dataclass(frozen=True)
+class PageWindow:
+    """
+    Rows [start, stop) of a table shown as page `page` of `num_pages`.
+    """
+    start: int
+    stop: int
+    page: int
+    num_pages: int
+
+
+def page_window(num_rows: int, page_size: int, page: int = 1) -> PageWindow:
+    """
+    The window of rows on a 1-based page (clamped to the pages that exist).
+    """
+    num_pages = max((num_rows + page_size - 1) // page_size, 1)
+    page = min(max(int(page), 1), num_pages)
+    start = (page - 1) * page_size
+    return PageWindow(start=start, stop=min(start + page_size, num_rows), page=page, num_pages=num_pages)
+
+
+def paginate(df: pd.DataFrame, *, key: str, page_size: int = 50, search_column: str = "Player") -> pd.DataFrame:
+    """
+    Renders search and page controls for a table and returns only the rows
+    to show, so large leagues never send the whole table to the browser.
+
+    Searching an exact name jumps to the page holding that row (e.g. a
+    player's rank in the standings); any other search narrows the table to
+    the matching rows.
+    """
+    search_key, page_key = f"{key}_search", f"{key}_page"
+    names = df[search_column].astype(str)
+
+    c1, c2 = st.columns([0.7, 0.3])
+    search = c1.text_input(
+        "Find player",
+        key=search_key,
+        placeholder="Type a name to jump to their row...",
+        on_change=_jump_to_match,
+        args=(names, search_key, page_key, page_size),
+    ).strip()
+
+    # narrow to matches unless the search names a row exactly
+    if search and not names.str.lower().eq(search.lower()).any():
+        df = df.loc[names.str.contains(search, case=False, regex=False).to_numpy()]
+
+    num_pages = page_window(len(df), page_size).num_pages
+    if st.session_state.get(page_key, 1) > num_pages:
+        st.session_state[page_key] = num_pages
+    page = c2.number_input(f"Page (of {num_pages})", min_value=1, max_value=num_pages, step=1, key=page_key)
+
+    window = page_window(len(df), page_size, page)
+    if len(df):
+        st.caption(f"Showing {window.start + 1}-{window.stop} of {len(df):,}")
+    else:
+        st.caption("No matching players.")
+    return df.iloc[window.start:window.stop]
+
+
+def _jump_to_match(names: pd.Series, search_key: str, page_key: str, page_size: int):
+    """
+    Search callback: moves to the page of an exact match, else to page 1.
+    """
+    search = st.session_state.get(search_key, "").strip().lower()
+    matches = (names.str.lower() == search).to_numpy().nonzero()[0] if search else []
+    st.session_state[page_key] = int(matches[0]) // page_size + 1 if len(matches) else 1
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# local imports
+from .season_schema import PICK_COLS
+
+@dataclass(frozen=True)
+class PickIndex:
+    """
+    Inverted index from (week, team_id) to the score rows that picked it.
+
+    Stored in CSR form: the entries for cell `key = week * (teams + 1) + team`
+    are `rows[offsets[key]:offsets[key + 1]]`, with the pick slot (position
+    in PICK_COLS) alongside in `slots`.
+
+    Attributes:
+        num_teams (int): Number of registry teams.
+        offsets (np.ndarray): Start of each (week, team) cell in rows/slots.
+        rows (np.ndarray): Row positions in overall_scores.
+        slots (np.ndarray): Pick slot of each entry.
+        codes (np.ndarray): Team ID of every pick, shape (rows, len(PICK_COLS)).
+        weeks (np.ndarray): Week of every row.
+    """
+    num_teams: int
+    offsets: np.ndarray
+    rows: np.ndarray
+    slots: np.ndarray
+    codes: np.ndarray
+    weeks: np.ndarray
+
+    def lookup(self, weeks: np.ndarray, teams: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Rows and pick slots for every (week, team) cell given.
+        """
+        keys = np.asarray(weeks) * (self.num_teams + 1) + np.asarray(teams)
+        keys = keys[keys < len(self.offsets) - 1]  # weeks without picks
+        starts, ends = self.offsets[keys], self.offsets[keys + 1]
+        lengths = ends - starts
+        if lengths.sum() == 0:
+            return np.array([], dtype=self.rows.dtype), np.array([], dtype=self.slots.dtype)
+
+        # concatenate the cells' ranges without a Python loop
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        return self.rows[positions], self.slots[positions]
+
+
+def build_pick_index(overall_scores: pd.DataFrame, num_teams: int) -> PickIndex:
+    """
+    Builds the index from compact overall scores (see `compact_scores`).
+
+    Pick categories past the registry teams (unknown spellings) and missing
+    picks are stored as team -1 and left out of the index.
+    """
+    codes = np.column_stack([overall_scores[col].cat.codes.to_numpy() for col in PICK_COLS]).astype(np.int16)
+    codes[codes >= num_teams] = -1
+    weeks = overall_scores["Week"].to_numpy(dtype=np.int64)
+
+    # sort every known pick by (week, team)
+    row, slot = np.nonzero(codes >= 0)
+    keys = weeks[row] * (num_teams + 1) + codes[row, slot]
+    order = np.argsort(keys, kind="stable")
+    num_cells = (int(weeks.max(initial=0)) + 1) * (num_teams + 1)
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(keys, minlength=num_cells))])
+
+    return PickIndex(
+        num_teams=num_teams,
+        offsets=offsets,
+        rows=row[order].astype(np.int32),
+        slots=slot[order].astype(np.int8),
+        codes=codes,
+        weeks=weeks,
+    )
@@ -0,0 +1,26 @@
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+# local imports
+from .calculate_week import calculate_week
+
+ET = ZoneInfo("America/New_York")
+
+# kickoff of week 1's Sunday games; each week's picks go public at its Sunday kickoff
+FIRST_SUNDAY = datetime(2025, 9, 7, 13, 0, 0, tzinfo=ET)  # CHANGE THIS if needed
+
+def picks_released(week: int, now: datetime | None = None) -> bool:
+    """
+    Whether a week's picks are public (released at kickoff of Sunday games).
+    """
+    now = now or datetime.now(ET)
+    return now > FIRST_SUNDAY + timedelta(weeks=week - 1)
+
+
+def released_through_week(now: datetime | None = None) -> int:
+    """
+    Last week whose picks are public; the current week's picks don't count
+    until kickoff.
+    """
+    current_week = calculate_week()
+    return current_week if picks_released(current_week, now) else current_week - 1
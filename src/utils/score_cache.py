@@ -0,0 +1,98 @@
+import threading
+
+import pandas as pd
+import streamlit as st
+
+# local imports
+from .hash_frame import hash_frame
+from .live_scoring import LiveUpdate, rescore_changed_games
+from .outcome_index import OutcomeIndex
+from .pick_index import PickIndex, build_pick_index
+from .score_season import score_weeks
+from .season_schema import compact_scores, concat_compact
+
+
+class ScoreCache:
+    """
+    Scored weeks keyed by a content hash of each week's picks and games.
+
+    Weeks whose inputs hash the same as last time reuse their rows of the
+    previous season frame, so only weeks that actually changed are rescored.
+    Only the combined compact frame is kept (per week, just the hashes of
+    the inputs its rows were scored from). When only game
+    outcomes changed (no picks did), the previous season frame is patched
+    through the (week, team) pick index instead, touching only the picks
+    whose game or spread outcome flipped.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._weeks: dict[int, tuple[str, str]] = {}
+        self._combined: tuple[tuple, pd.DataFrame] | None = None
+        self._outcomes: OutcomeIndex | None = None
+        self._pick_index: PickIndex | None = None
+
+    def score(self, season) -> pd.DataFrame:
+        """
+        Returns overall scores for the season, rescoring only changed weeks.
+        """
+        return self.score_live(season)[0]
+
+    def score_live(self, season) -> tuple[pd.DataFrame, LiveUpdate | None]:
+        """
+        Returns overall scores for the season and, if they were produced by
+        patching the previous frame, the LiveUpdate describing the patch.
+        """
+        weeks = sorted(season.picks)
+        keys = {
+            w: (hash_frame(season.picks[w]), hash_frame(season.games[w]))
+            for w in weeks
+        }
+        season_key = tuple(keys[w] for w in weeks)
+
+        with self._lock:
+            # nothing changed since last refresh
+            if self._combined is not None and self._combined[0] == season_key:
+                return self._combined[1], None
+
+            # only game outcomes changed: patch the affected picks
+            previous_keys = self._combined[0] if self._combined is not None else ()
+            if len(previous_keys) == len(weeks) and all(
+                previous[0] == current[0] for previous, current in zip(previous_keys, season_key)
+            ):
+                overall_scores, update = rescore_changed_games(
+                    self._combined[1], self._pick_index, self._outcomes, season.outcomes
+                )
+                self._weeks = keys
+                self._combined = (season_key, overall_scores)
+                self._outcomes = season.outcomes
+                return overall_scores, update
+
+            # rescore changed weeks in a single pass, reuse the rest
+            changed = [w for w in weeks if self._weeks.get(w) != keys[w]]
+            scored = {}
+            if changed:
+                wide = score_weeks({w: season.picks[w] for w in changed}, season.outcomes)
+                by_week = dict(tuple(wide.groupby("Week", sort=False)))
+                scored = {w: compact_scores(by_week.get(w, wide.iloc[0:0]), season.teams) for w in changed}
+            if len(scored) < len(weeks):
+                previous = self._combined[1]
+                rows = previous.groupby("Week", sort=False, observed=True).indices
+                for w in weeks:
+                    if w not in scored:
+                        scored[w] = previous.iloc[rows.get(w, [])]
+
+            overall_scores = concat_compact([scored[w] for w in weeks], season.teams)
+            self._weeks = keys
+            self._combined = (season_key, overall_scores)
+            self._outcomes = season.outcomes
+            self._pick_index = build_pick_index(overall_scores, len(season.teams))
+
+        return overall_scores, None
+
+
+@st.cache_resource
+def get_score_cache() -> ScoreCache:
+    """
+    Process-wide score cache shared by every session.
+    """
+    return ScoreCache()
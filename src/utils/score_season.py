@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+# local imports
+from .outcome_index import OutcomeIndex
+from .season_schema import PICK_COLS, SPREAD_POINT_COLS, SPREAD_WEIGHTS, compact_scores
+
+def score_season(season) -> pd.DataFrame:
+    """
+    Scores every week of a loaded Season in a single pass, returning the
+    compact schema (see `compact_scores`).
+    """
+    return compact_scores(score_weeks(season.picks, season.outcomes), season.teams)
+
+
+def score_weeks(
+    picks_by_week: dict[int, pd.DataFrame],
+    outcomes: OutcomeIndex
+) -> pd.DataFrame:
+    """
+    Scores every player for every week at once.
+
+    Picks are mapped to registry IDs (so aliases and case/whitespace variants
+    score like the canonical team) and scored with a single NumPy gather into
+    the season's [week, team] outcome index.
+
+    Rules:
+        * Survivor Point is 1 if the survivor pick won its game.
+        * Spread picks score 1.0 for a cover, 0.5 for a push and 0.0 otherwise,
+          with the 2 point spread weighted 2x.
+        * Total Points only count if the survivor pick won.
+        * Special is flagged when the survivor lost but every spread pick covered.
+    """
+    weeks = sorted(picks_by_week)
+
+    # stack picks for the whole season
+    picks = pd.concat([picks_by_week[w] for w in weeks], axis=0)
+    pick_week = np.repeat(weeks, [len(picks_by_week[w]) for w in weeks])
+
+    # team IDs for every pick (-1 reads the index's empty "unknown team" column)
+    pick_codes = outcomes.teams.encode(picks[PICK_COLS].to_numpy(dtype=object))
+
+    # score picks
+    survivor, spread_points, total, special = score_pick_codes(pick_week, pick_codes, outcomes)
+    points_data = picks.copy()
+    points_data["Survivor Point"] = survivor.astype(int)
+    points_data[SPREAD_POINT_COLS] = spread_points
+    points_data["Total Points"] = total
+    points_data["Special"] = special.astype(int)
+
+    # add week
+    points_data["Week"] = pick_week
+
+    return points_data
+
+
+def score_pick_codes(
+    pick_week: np.ndarray,
+    pick_codes: np.ndarray,
+    outcomes: OutcomeIndex
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Applies the scoring rules to team IDs (one row per entry, one column per
+    pick in PICK_COLS order).
+
+    Returns:
+        tuple: Survivor point, weighted spread points (one column per spread
+            pick), total points and the special flag, one value per row.
+    """
+    survivor = outcomes.game_winner[pick_week, pick_codes[:, 0]]
+
+    weights = np.fromiter(SPREAD_WEIGHTS.values(), dtype=float)
+    spread_points = outcomes.base_points[pick_week[:, None], pick_codes[:, 1:]] * weights
+
+    # total points (survivor gate)
+    spread_total = spread_points.sum(axis=1)
+    total = survivor * spread_total
+
+    # add special prize calculation
+    special = ~survivor & (spread_total == 6)
+
+    return survivor, spread_points, total, special
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+# local imports
+from .teams import TeamRegistry
+
+PICK_COLS = [
+    "Survivor Pick",
+    "2 Point Spread",
+    "1 Point Spread (1)",
+    "1 Point Spread (2)",
+    "1 Point Spread (3)",
+    "1 Point Spread (4)",
+]
+SPREAD_WEIGHTS = {
+    "2 Point Spread": 2.0,
+    "1 Point Spread (1)": 1.0,
+    "1 Point Spread (2)": 1.0,
+    "1 Point Spread (3)": 1.0,
+    "1 Point Spread (4)": 1.0,
+}
+SPREAD_POINT_COLS = [f"{col} Points" for col in SPREAD_WEIGHTS]
+MAX_WEEKLY_POINTS = sum(SPREAD_WEIGHTS.values())
+
+
+def compact_scores(overall_scores: pd.DataFrame, teams: TeamRegistry) -> pd.DataFrame:
+    """
+    Converts overall scores to the compact in-memory schema.
+
+    The following dtypes are used:
+        * Player: category
+        * Pick columns: one categorical shared by all six columns, holding
+          the registry's canonical teams followed by any other values seen
+          (aliases, case and whitespace are normalized)
+        * Survivor Point, Special, Week: int8
+        * Spread points and Total Points: float32 (exact for half points)
+    """
+    compact = overall_scores.copy()
+
+    # one team categorical shared by every pick column
+    picks = teams.canonicalize(compact[PICK_COLS].to_numpy(dtype=object))
+    extras = sorted({v for v in pd.unique(picks.ravel()) if v is not None} - set(teams.teams))
+    team_dtype = pd.CategoricalDtype(list(teams.teams) + extras)
+    for i, col in enumerate(PICK_COLS):
+        compact[col] = pd.Categorical(picks[:, i], dtype=team_dtype)
+
+    # interned player names
+    compact["Player"] = compact["Player"].astype("category")
+
+    # small numeric widths
+    compact["Survivor Point"] = compact["Survivor Point"].astype(np.int8)
+    compact["Special"] = compact["Special"].astype(np.int8)
+    compact["Week"] = compact["Week"].astype(np.int8)
+    compact[SPREAD_POINT_COLS + ["Total Points"]] = compact[SPREAD_POINT_COLS + ["Total Points"]].astype(np.float32)
+
+    return compact
+
+
+def concat_compact(frames: list[pd.DataFrame], teams: TeamRegistry) -> pd.DataFrame:
+    """
+    Concatenates compact score frames (see `compact_scores`) into one.
+
+    The frames' categoricals are widened to the union of their categories
+    first (registry teams, then every extra value sorted; player names
+    sorted), so the result matches compacting the concatenated wide frames.
+    """
+    extras = sorted(set().union(*(frame[PICK_COLS[0]].cat.categories for frame in frames)) - set(teams.teams))
+    team_dtype = pd.CategoricalDtype(list(teams.teams) + extras)
+    player_dtype = pd.CategoricalDtype(sorted(set().union(*(frame["Player"].cat.categories for frame in frames))))
+
+    aligned = []
+    for frame in frames:
+        frame = frame.copy()
+        for col in PICK_COLS:
+            frame[col] = frame[col].cat.set_categories(team_dtype.categories)
+        frame["Player"] = frame["Player"].cat.set_categories(player_dtype.categories)
+        aligned.append(frame)
+    return pd.concat(aligned, axis=0)
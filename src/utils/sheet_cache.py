@@ -0,0 +1,131 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Hashable, Iterable
+
+import pandas as pd
+import streamlit as st
+
+# local imports
+from .hash_frame import hash_frame
+
+class SheetCache:
+    """
+    Process-wide TTL cache with in-flight request de-duplication.
+
+    Concurrent callers asking for the same key while it is being loaded wait
+    on the single in-flight request instead of starting their own, so each
+    sheet is downloaded at most once per refresh window.
+
+    Entries older than `ttl` but younger than `ttl + max_stale` are served
+    stale while a background worker refetches them (stale-while-revalidate),
+    so once the cache is warm no caller blocks on a download. Set
+    `max_stale` to 0 to always refetch synchronously on expiry.
+
+    `version` is bumped whenever a (re)load stores content that differs from
+    what was cached before, so consumers can cheaply detect new data.
+    """
+    def __init__(self, ttl: float, max_stale: float = 0, refresh_workers: int = 2):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[float, object, str, Callable[[], object]]] = {}
+        self._inflight: dict[Hashable, Future] = {}
+        self.version = 0
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="sheet-refresh")
+
+    def get(self, key: Hashable, loader: Callable[[], object]):
+        """
+        Returns the cached value for key, loading it if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry[0]
+                if age < self.ttl:
+                    return entry[1]
+
+                # serve stale, refetch in the background
+                if age < self.ttl + self.max_stale:
+                    self._refresh_in_background(key, loader)
+                    return entry[1]
+
+            # join the in-flight request, or become its owner
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if owner:
+            self._load(key, loader, future)
+        return future.result()
+
+    def revalidate(self, keys: Iterable[Hashable] | None = None) -> bool:
+        """
+        Starts background refreshes for every stale entry (only those in
+        keys, if given).
+
+        Returns True if any of those entries is past its maximum staleness,
+        meaning the next `get` for it will block on a fresh download.
+        """
+        now = time.monotonic()
+        hard_expired = False
+        with self._lock:
+            entries = self._entries if keys is None else {k: self._entries[k] for k in keys if k in self._entries}
+            for key, (stored_at, _, _, loader) in entries.items():
+                age = now - stored_at
+                if age >= self.ttl + self.max_stale:
+                    hard_expired = True
+                elif age >= self.ttl:
+                    self._refresh_in_background(key, loader)
+        return hard_expired
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _refresh_in_background(self, key: Hashable, loader: Callable[[], object]):
+        """
+        Queues a background refetch of key (caller holds the lock).
+        """
+        if key not in self._inflight:
+            future = Future()
+            self._inflight[key] = future
+            self._refresher.submit(self._load, key, loader, future)
+
+    def _load(self, key: Hashable, loader: Callable[[], object], future: Future):
+        """
+        Runs loader for key and resolves its in-flight future.
+        """
+        try:
+            value = loader()
+        except BaseException as e:
+            # a failed refresh keeps serving the stale entry
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            return
+
+        fingerprint = _fingerprint(value)
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is None or previous[2] != fingerprint:
+                self.version += 1
+            self._entries[key] = (time.monotonic(), value, fingerprint, loader)
+            del self._inflight[key]
+        future.set_result(value)
+
+
+def _fingerprint(value: object) -> str:
+    if isinstance(value, pd.DataFrame):
+        return hash_frame(value)
+    return repr(value)
+
+
+@st.cache_resource
+def get_sheet_cache(ttl: float = 3600, max_stale: float = 0) -> SheetCache:
+    """
+    Sheet cache shared by every page and session.
+    """
+    return SheetCache(ttl=ttl, max_stale=max_stale)
@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# local imports
+from .load_yaml import load_yaml
+
+DEFAULT_LOGOS_PATH = "config/logos.yaml"
+
+@dataclass(frozen=True)
+class TeamRegistry:
+    """
+    Dense integer IDs for every NFL team, with alias normalization.
+
+    Attributes:
+        teams (tuple[str, ...]): Canonical abbreviations; a team's ID is its position.
+        ids (dict[str, int]): Every accepted (upper-case) spelling -> team ID.
+    """
+    teams: tuple[str, ...]
+    ids: dict[str, int] = field(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+    def encode(self, values) -> np.ndarray:
+        """
+        Maps team spellings to team IDs (-1 for missing or unknown values).
+
+        Case and whitespace are normalized once per distinct value, so the
+        cost is a single factorize over the input.
+        """
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object).ravel())
+        unique_ids = np.fromiter(
+            (self.ids.get(_normalize(value), -1) for value in uniques),
+            dtype=np.int16,
+            count=len(uniques),
+        )
+        ids = np.append(unique_ids, np.int16(-1))[codes]  # code -1 (missing) -> -1
+        return ids.reshape(np.shape(values))
+
+    def canonicalize(self, values) -> np.ndarray:
+        """
+        Maps team spellings to canonical abbreviations.
+
+        Unknown values are kept (stripped, upper-case) and missing values stay missing.
+        """
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object).ravel())
+        names = [
+            self.teams[self.ids[key]] if key in self.ids else key
+            for key in map(_normalize, uniques)
+        ]
+        canonical = np.asarray(names + [None], dtype=object)[codes]  # code -1 (missing) -> None
+        return canonical.reshape(np.shape(values))
+
+
+def _normalize(value) -> str:
+    return str(value).strip().upper()
+
+
+def build_team_registry(logos: dict) -> TeamRegistry:
+    """
+    Builds the registry from the team -> logo URL mapping.
+
+    Keys sharing a logo are aliases of one team; the first key listed for a
+    logo is its canonical abbreviation (e.g. LAR for LA, WAS for WSH).
+    """
+    canonical_by_logo = {}
+    for team, logo in logos.items():
+        canonical_by_logo.setdefault(logo, _normalize(team))
+
+    teams = tuple(sorted(canonical_by_logo.values()))
+    team_ids = {team: i for i, team in enumerate(teams)}
+    ids = {_normalize(team): team_ids[canonical_by_logo[logo]] for team, logo in logos.items()}
+
+    return TeamRegistry(teams=teams, ids=ids)
+
+
+@lru_cache(maxsize=None)
+def load_team_registry(logos_path: str = DEFAULT_LOGOS_PATH) -> TeamRegistry:
+    """
+    Loads (once per process) the team registry for a logos YAML file.
+    """
+    return build_team_registry(load_yaml(logos_path))
@@ -0,0 +1,97 @@
+import base64
+import io
+import shutil
+import urllib.error
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from src.utils import logo_assets
+from src.utils.logo_assets import LogoAssets, build_logo_assets
+
+FIXTURES = Path(__file__).parent / "fixtures" / "logos"
+WIDE = str(FIXTURES / "wide.png")    # 200 x 100
+SMALL = str(FIXTURES / "small.png")  # 40 x 40
+
+
+def _decode(uri: str) -> Image.Image:
+    assert uri.startswith("data:image/png;base64,")
+    return Image.open(io.BytesIO(base64.b64decode(uri.split(",", 1)[1])))
+
+
+@pytest.fixture(autouse=True)
+def no_network(monkeypatch):
+    """
+    Any URL source fails like an unreachable host.
+    """
+    def urlopen(url, timeout=None):
+        raise urllib.error.URLError("network disabled in tests")
+    monkeypatch.setattr(logo_assets.urllib.request, "urlopen", urlopen)
+
+
+def test_resizes_to_height_keeping_aspect(tmp_path):
+    uris = build_logo_assets({"ARI": WIDE}, str(tmp_path), height=40)
+    assert _decode(uris["ARI"]).size == (80, 40)
+
+
+def test_never_upscales(tmp_path):
+    uris = build_logo_assets({"SF": SMALL}, str(tmp_path), height=80)
+    assert _decode(uris["SF"]).size == (40, 40)
+
+
+def test_aliases_share_one_file(tmp_path):
+    uris = build_logo_assets({"LAR": WIDE, "LA": WIDE}, str(tmp_path), height=40)
+    assert uris["LAR"] == uris["LA"]
+    assert len(list(tmp_path.glob("*.png"))) == 1
+
+
+def test_cache_hit_reuses_resized_file(tmp_path, monkeypatch):
+    first = build_logo_assets({"ARI": WIDE}, str(tmp_path), height=40)
+
+    # a new store (e.g. after a restart) reads the resized file, not the source
+    def read_source(source):
+        raise AssertionError("source read again")
+    monkeypatch.setattr(logo_assets, "_read_source", read_source)
+    assert build_logo_assets({"ARI": WIDE}, str(tmp_path), height=40) == first
+
+
+def test_store_keeps_loaded_logos_in_memory(tmp_path, monkeypatch):
+    store = LogoAssets(str(tmp_path), height=40)
+    first = store.get({"ARI": WIDE})
+
+    def load(source):
+        raise AssertionError("logo loaded again")
+    monkeypatch.setattr(store, "_load", load)
+    assert store.get({"ARI": WIDE}) == first
+
+
+def test_failed_fetch_falls_back_to_source(tmp_path):
+    url = "https://example.invalid/ari.png"
+    corrupt = str(FIXTURES / "corrupt.png")
+    uris = build_logo_assets({"ARI": url, "SF": corrupt, "SEA": SMALL}, str(tmp_path), height=40)
+    assert uris["ARI"] == url
+    assert uris["SF"] == corrupt
+    assert uris["SEA"].startswith("data:image/png;base64,")
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_failed_logo_is_retried_not_cached(tmp_path):
+    source = str(tmp_path / "late.png")
+    store = LogoAssets(str(tmp_path / "cache"), height=40, retry_after=0)
+    assert store.get({"ARI": source}) == {"ARI": source}
+
+    # the source becomes available: the next call loads it
+    shutil.copy(WIDE, source)
+    assert _decode(store.get({"ARI": source})["ARI"]).size == (80, 40)
+
+
+def test_failed_logo_waits_before_retrying(tmp_path, monkeypatch):
+    store = LogoAssets(str(tmp_path), height=40, retry_after=3600)
+    url = "https://example.invalid/ari.png"
+    store.get({"ARI": url})
+
+    calls = []
+    monkeypatch.setattr(store, "_load", lambda source: calls.append(source))
+    assert store.get({"ARI": url}) == {"ARI": url}
+    assert calls == []
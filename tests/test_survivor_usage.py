@@ -0,0 +1,31 @@
+import pandas as pd
+
+from src.logic.survivor_usage import build_survivor_usage
+from src.utils import build_team_registry
+
+TEAMS = build_team_registry({"ARI": "ari.png", "BUF": "buf.png", "SF": "sf.png"})
+
+
+def _usage():
+    scores = pd.DataFrame({
+        "Player": ["amy", "amy", "amy", "bob"],
+        "Week": [1, 2, 3, 1],
+        "Survivor Pick": ["ARI", "BUF", "SF", "BUF"],
+    })
+    return build_survivor_usage(scores, TEAMS, num_weeks=4)
+
+
+def test_can_pick_excludes_used_teams():
+    usage = _usage()
+    eligible = usage.players[usage.can_pick(TEAMS.teams.index("SF"), 4)]
+    assert list(eligible) == ["bob"]
+
+
+def test_can_pick_ignores_weeks_after_cutoff():
+    usage = _usage()
+    # amy's week 3 pick is not released yet: SF still counts as available
+    sf = TEAMS.teams.index("SF")
+    assert list(usage.players[usage.can_pick(sf, 4, through=2)]) == ["amy", "bob"]
+    # released weeks still count
+    buf = TEAMS.teams.index("BUF")
+    assert list(usage.players[usage.can_pick(buf, 4, through=2)]) == []